@@ -29,8 +29,11 @@ from .const import (
     ATTR_NOTIFY,
     ATTR_MAX_PERCENTAGE,
     ATTR_TARGET_TIME,
+    DAYS_OF_WEEK,
+    CONNECTED_STATES,
 )
 from .coordinator import OctopusSpainDataUpdateCoordinator
+from .helpers import device_current_state
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -120,13 +123,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def _get_single_charger_id(coordinator: OctopusSpainDataUpdateCoordinator) -> str | None:
     """Get the ID of the single EV charger in the account."""
     try:
-        for account_number, account_devices in coordinator.data.get("devices", {}).items():
-            for device in account_devices:
-                if device.get("__typename") == "SmartFlexChargePoint":
-                    device_id = device.get("id")
-                    device_name = device.get("name", "Unknown")
-                    _LOGGER.debug("Found EV charger: %s (ID: %s)", device_name, device_id)
-                    return device_id
+        for account_number, device in coordinator.chargepoint_devices:
+            device_id = device.get("id")
+            device_name = device.get("name", "Unknown")
+            _LOGGER.debug("Found EV charger: %s (ID: %s)", device_name, device_id)
+            return device_id
         
         _LOGGER.warning("No SmartFlexChargePoint found in any account")
         return None
@@ -147,9 +148,9 @@ async def _async_register_services(hass: HomeAssistant, coordinator: OctopusSpai
             await coordinator.api.start_boost_charge(device_id)
             _LOGGER.info("Started boost charging for device %s", device_id)
             
-            # Wait and refresh
-            await asyncio.sleep(3)
-            await coordinator.async_refresh_specific_device(device_id)
+            # Show the new state now and refresh once the change has propagated
+            coordinator.async_store_device_state(device_id, "BOOSTING")
+            await coordinator.async_request_device_refresh(device_id)
             
         except Exception as err:
             _LOGGER.error("Failed to start boost charging for device %s: %s", device_id, err)
@@ -163,9 +164,9 @@ async def _async_register_services(hass: HomeAssistant, coordinator: OctopusSpai
             await coordinator.api.stop_boost_charge(device_id)
             _LOGGER.info("Stopped boost charging for device %s", device_id)
             
-            # Wait and refresh
-            await asyncio.sleep(3)
-            await coordinator.async_refresh_specific_device(device_id)
+            # Show the new state now and refresh once the change has propagated
+            coordinator.async_store_device_state(device_id, "SMART_CONTROL_CAPABLE")
+            await coordinator.async_request_device_refresh(device_id)
             
         except Exception as err:
             _LOGGER.error("Failed to stop boost charging for device %s: %s", device_id, err)
@@ -199,7 +200,7 @@ async def _async_register_services(hass: HomeAssistant, coordinator: OctopusSpai
             
             # Get current state before refresh
             current_device = await coordinator.async_get_device_data(charger_device_id)
-            current_state = current_device.get("status", {}).get("currentState") if current_device else None
+            current_state = device_current_state(current_device)
             device_name = current_device.get("name", "EV Charger") if current_device else "EV Charger"
             
             # Refresh the charger
@@ -207,7 +208,7 @@ async def _async_register_services(hass: HomeAssistant, coordinator: OctopusSpai
             
             # Get new state after refresh
             new_device = await coordinator.async_get_device_data(charger_device_id)
-            new_state = new_device.get("status", {}).get("currentState") if new_device else None
+            new_state = device_current_state(new_device)
             
             # Log the change
             _LOGGER.info("Charger check: %s | State: %s → %s", device_name, current_state, new_state)
@@ -228,7 +229,7 @@ async def _async_register_services(hass: HomeAssistant, coordinator: OctopusSpai
                 
                 # Add planned dispatches info
                 dispatches_count = coordinator.get_planned_dispatches_count(charger_device_id)
-                if new_state in ["SMART_CONTROL_CAPABLE", "BOOSTING", "SMART_CONTROL_IN_PROGRESS"]:
+                if new_state in CONNECTED_STATES:
                     message += f" | {dispatches_count} sesiones programadas"
                 
                 # Determine icon
@@ -260,7 +261,7 @@ async def _async_register_services(hass: HomeAssistant, coordinator: OctopusSpai
                 "old_state": current_state,
                 "new_state": new_state,
                 "state_changed": current_state != new_state,
-                "is_connected": new_state in ["SMART_CONTROL_CAPABLE", "BOOSTING", "SMART_CONTROL_IN_PROGRESS"],
+                "is_connected": new_state in CONNECTED_STATES,
                 "planned_dispatches_count": coordinator.get_planned_dispatches_count(charger_device_id),
             })
                 
@@ -303,18 +304,14 @@ async def _async_register_services(hass: HomeAssistant, coordinator: OctopusSpai
         
         try:
             # Create schedules for all days of the week
-            days = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]
-            schedules = []
-            
-            for day in days:
-                schedules.append({
-                    "dayOfWeek": day,
-                    "time": target_time,
-                    "max": float(max_percentage)
-                })
+            max_value = float(max_percentage)
+            schedules = [
+                {"dayOfWeek": day, "time": target_time, "max": max_value}
+                for day in DAYS_OF_WEEK
+            ]
             
             # Set preferences
-            await coordinator.api.set_smart_flex_device_preferences(
+            updated = await coordinator.api.set_smart_flex_device_preferences(
                 device_id=device_id,
                 mode="CHARGE",
                 unit="PERCENTAGE", 
@@ -323,9 +320,9 @@ async def _async_register_services(hass: HomeAssistant, coordinator: OctopusSpai
             
             _LOGGER.info("Updated preferences for device %s: %s%% at %s", device_id, max_percentage, target_time)
             
-            # Refresh device data
-            await asyncio.sleep(2)
-            await coordinator.async_refresh_specific_device(device_id)
+            # Show the accepted preferences now; the refresh only confirms them
+            coordinator.async_store_device_preferences(device_id, updated)
+            await coordinator.async_request_device_refresh(device_id)
             
             # Get device name for notification
             device_data = await coordinator.async_get_device_data(device_id)
@@ -13,6 +13,10 @@ _LOGGER = logging.getLogger(__name__)
 GRAPH_QL_ENDPOINT = "https://api.oees-kraken.energy/v1/graphql/"
 
 
+class OctopusSpainAPIError(Exception):
+    """Error reported by the Octopus Energy Spain API."""
+
+
 class OctopusSpainAPI:
     """API client for Octopus Energy Spain - FIXED to follow original pattern."""
 
@@ -65,7 +69,7 @@ class OctopusSpainAPI:
     async def _execute_query(self, query: str, variables: dict = None) -> dict:
         """Execute a GraphQL query - NO AUTO RE-LOGIN like original."""
         if not self._client:
-            raise Exception("Not authenticated - call login() first")
+            raise OctopusSpainAPIError("Not authenticated - call login() first")
             
         try:
             response = await self._client.execute_async(query, variables or {})
@@ -73,7 +77,7 @@ class OctopusSpainAPI:
             if "errors" in response:
                 # Log the error but don't auto-retry - let coordinator handle it
                 _LOGGER.warning("GraphQL errors: %s", response["errors"])
-                raise Exception(f"GraphQL errors: {response['errors']}")
+                raise OctopusSpainAPIError(f"GraphQL errors: {response['errors']}")
                 
             return response
             
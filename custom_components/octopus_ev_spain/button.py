@@ -11,11 +11,17 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, CONNECTED_STATES
 from .coordinator import OctopusSpainDataUpdateCoordinator
+from .helpers import device_current_state, safe_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+# Display name of each button type
+BUTTON_NAMES: dict[str, str] = {
+    "refresh_charger": "Actualizar y Verificar Estado",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -25,43 +31,18 @@ async def async_setup_entry(
     """Set up Octopus Energy Spain buttons."""
     coordinator: OctopusSpainDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[ButtonEntity] = []
-
     # Add utility button for each charger - ONLY ONE REFRESH BUTTON
-    for account_number, devices in coordinator.data.get("devices", {}).items():
-        for device in devices:
-            if device.get("__typename") == "SmartFlexChargePoint":
-                device_id = device["id"]
-                # Solo añadir un botón de refresco por cargador
-                entities.append(
-                    OctopusRefreshChargerButton(coordinator, account_number, device_id)
-                )
-
-    async_add_entities(entities)
-
-
-def _safe_device_info(device_id: str, device: dict[str, Any] | None) -> dict[str, Any]:
-    """Safely create device info."""
-    if not device:
-        return {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": "Dispositivo Desconocido",
-            "manufacturer": "Lockevod",
-            "model": "Desconocido",
-        }
-        
-    return {
-        "identifiers": {(DOMAIN, device_id)},
-        "name": device.get("name", "Dispositivo Desconocido"),
-        "manufacturer": "Lockevod",
-        "model": f"{device.get('__typename', 'Desconocido')} ({device.get('provider', 'Desconocido')})",
-        "sw_version": device.get("deviceType", "Desconocido"),
-    }
+    async_add_entities([
+        OctopusRefreshChargerButton(coordinator, account_number, device["id"])
+        for account_number, device in coordinator.chargepoint_devices
+    ])
 
 
 class OctopusDeviceButton(CoordinatorEntity, ButtonEntity):
     """Base class for Octopus device buttons."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: OctopusSpainDataUpdateCoordinator,
@@ -76,37 +57,25 @@ class OctopusDeviceButton(CoordinatorEntity, ButtonEntity):
         self._button_type = button_type
         
         device = self._get_device_data()
+        self._attr_device_info = safe_device_info(device_id, device)
         device_name = device.get("name", "Dispositivo Desconocido") if device else "Dispositivo Desconocido"
         
-        button_names = {
-            "refresh_charger": "Actualizar y Verificar Estado",
-        }
-        
-        button_name = button_names.get(button_type, button_type.replace('_', ' ').title())
+        button_name = BUTTON_NAMES.get(button_type, button_type.replace('_', ' ').title())
         self._attr_name = f"{device_name} {button_name}"
         self._attr_unique_id = f"octopus_{device_id}_{button_type}"
 
     def _get_device_data(self) -> dict[str, Any] | None:
         """Get device data from coordinator."""
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            _LOGGER.warning("Failed to get device data for %s", self._device_id)
-        return None
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
+        return self.coordinator.devices_by_id.get(self._device_id)
 
 
 class OctopusRefreshChargerButton(OctopusDeviceButton):
     """Button to refresh charger data and check status - UNIFIED."""
 
+    __slots__ = ()
+
+    _attr_icon = "mdi:refresh-circle"
+
     def __init__(
         self,
         coordinator: OctopusSpainDataUpdateCoordinator,
@@ -115,7 +84,6 @@ class OctopusRefreshChargerButton(OctopusDeviceButton):
     ) -> None:
         """Initialize the button."""
         super().__init__(coordinator, account_number, device_id, "refresh_charger")
-        self._attr_icon = "mdi:refresh-circle"
 
     async def async_press(self) -> None:
         """Handle the button press - refresh and check status."""
@@ -126,14 +94,14 @@ class OctopusRefreshChargerButton(OctopusDeviceButton):
             _LOGGER.info("Manual refresh and status check for %s", device_name)
             
             # Get current state before refresh
-            current_state = device.get("status", {}).get("currentState") if device else None
+            current_state = device_current_state(device)
             
             # Refresh the device data
             await self.coordinator.async_refresh_specific_device(self._device_id)
             
             # Get new state after refresh
             updated_device = self._get_device_data()
-            new_state = updated_device.get("status", {}).get("currentState") if updated_device else None
+            new_state = device_current_state(updated_device)
             
             # Create status message
             state_translations = {
@@ -166,7 +134,7 @@ class OctopusRefreshChargerButton(OctopusDeviceButton):
                 notification_id = f"charger_status_check_{self._device_id}"
             
             # Add planned dispatches info if connected
-            if new_state in ["SMART_CONTROL_CAPABLE", "BOOSTING", "SMART_CONTROL_IN_PROGRESS"]:
+            if new_state in CONNECTED_STATES:
                 try:
                     dispatches_count = self.coordinator.get_planned_dispatches_count(self._device_id)
                     if dispatches_count > 0:
@@ -202,7 +170,7 @@ class OctopusRefreshChargerButton(OctopusDeviceButton):
                 "state_changed": current_state != new_state,
                 "old_state_translated": current_translated,
                 "new_state_translated": new_translated,
-                "is_connected": new_state in ["SMART_CONTROL_CAPABLE", "BOOSTING", "SMART_CONTROL_IN_PROGRESS"],
+                "is_connected": new_state in CONNECTED_STATES,
                 "planned_dispatches_count": planned_dispatches_count,
             })
             
@@ -39,6 +39,13 @@ DEVICE_STATE_CONNECTED = "SMART_CONTROL_CAPABLE"
 DEVICE_STATE_BOOST_CHARGING = "BOOSTING"
 DEVICE_STATE_SCHEDULED_CHARGING = "SMART_CONTROL_IN_PROGRESS"
 
+# States in which the car is plugged in to the charger
+CONNECTED_STATES: Final = frozenset({
+    DEVICE_STATE_CONNECTED,
+    DEVICE_STATE_BOOST_CHARGING,
+    DEVICE_STATE_SCHEDULED_CHARGING,
+})
+
 # Charging session types
 CHARGE_SESSION_TYPE_SMART = "SMART"
 CHARGE_SESSION_TYPE_MANUAL = "MANUAL"
@@ -67,19 +74,6 @@ SPANISH_TARIFF_PERIODS = {
 # EV charging discount price (€/kWh)
 EV_DISCOUNT_PRICE = 0.068
 
-# Services
-SERVICE_START_BOOST = "start_boost_charge"
-SERVICE_STOP_BOOST = "stop_boost_charge"
-SERVICE_REFRESH_CHARGER = "refresh_charger"
-SERVICE_CHECK_CHARGER = "check_charger"
-SERVICE_SET_PREFERENCES = "set_preferences"
-
-# Service data keys
-ATTR_DEVICE_ID = "device_id"
-ATTR_MAX_PERCENTAGE = "max_percentage"
-ATTR_TARGET_TIME = "target_time"
-ATTR_NOTIFY = "notify"
-
 # Error codes from API
 ERROR_CODE_AUTH_FAILED = "KT-CT-1124"
 ERROR_CODE_RATE_LIMITED = "KT-CT-1199"
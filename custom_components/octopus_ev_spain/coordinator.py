@@ -2,19 +2,90 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta, datetime
+from dataclasses import dataclass
+from datetime import date, timedelta, datetime
+from functools import cached_property, partial
 import logging
+from operator import itemgetter
+import sys
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+try:
+    import ciso8601
+except ImportError:  # ciso8601 ships with Home Assistant core
+    ciso8601 = None
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import OctopusSpainAPI
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
+from .const import (
+    DOMAIN,
+    DEFAULT_SCAN_INTERVAL,
+    DEVICE_TYPE_CHARGEPOINT,
+    ELECTRICITY_LEDGER,
+    SOLAR_WALLET_LEDGER,
+)
+from .helpers import device_current_state
 
 _LOGGER = logging.getLogger(__name__)
 
+# Enum-like device fields shared by many device records
+_INTERNED_DEVICE_KEYS = ("__typename", "deviceType", "provider")
+
+# Time the API gets to apply a change before the device is refreshed; further
+# changes to the same device within it share that single refresh, and changes
+# made while it runs get one more
+DEVICE_REFRESH_COOLDOWN = 3.0
+
+
+def parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp from the API, accepting a trailing 'Z'."""
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(value)
+    # fromisoformat understands a trailing "Z" on every Python HA 2025.1+ runs on
+    return datetime.fromisoformat(value)
+
+
+def _optional_float(value: Any) -> float | None:
+    """Convert an API number to float, or None when it is missing or not numeric."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        _LOGGER.debug("Non-numeric value from the API: %r", value)
+        return None
+
+
+def _round_hours(seconds: int, places: int) -> float:
+    """Convert whole seconds to hours, rounded half up to `places` decimals."""
+    step = 3600 // 10 ** places
+    return (seconds + step // 2) // step / 10 ** places
+
+
+def _session_edges(history: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return the charge session edges of a charge history, newest first."""
+    if not history:
+        return []
+    # history[0] is the device
+    return (history[0].get("chargePointChargingSession") or {}).get("edges") or []
+
+
+@dataclass(slots=True, frozen=True)
+class AccountSnapshot:
+    """Per-account values flattened once per refresh for the sensors."""
+
+    contract_number: str | None
+    address: str | None
+    cups: str | None
+    contract_type: str | None
+    valid_from: date | None
+    valid_to: date | None
+    ledgers_by_type: dict[str, dict[str, Any]]
+
 
 class OctopusSpainDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API - FIXED following original pattern."""
@@ -29,10 +100,56 @@ class OctopusSpainDataUpdateCoordinator(DataUpdateCoordinator):
         """Initialize."""
         self.api = api
         self.accounts: list[str] = []
+        self._device_refresh_timers: dict[str, CALLBACK_TYPE] = {}
+        self._device_refreshes_running: set[str] = set()
+        self._device_refreshes_pending: set[str] = set()
+        # Boost changes are sent from timers, outside PARALLEL_UPDATES, so the
+        # switches take this to send them to the API one at a time
+        self.charger_write_lock = asyncio.Lock()
         
         # Simple single interval like original
         super().__init__(hass, logger, name=DOMAIN, update_interval=update_interval)
 
+    @cached_property
+    def account_device_info(self) -> dict[str, Any]:
+        """Device info of the shared account device, built once per config entry."""
+        return {
+            "identifiers": {(DOMAIN, self.entry_id)},
+            "name": "Octopus Energy EV España",
+            "manufacturer": "Lockevod",
+            "model": "Spain",
+        }
+
+    @property
+    def devices_by_id(self) -> dict[str, dict[str, Any]]:
+        """Devices of every account indexed by device id."""
+        return self.data.get("devices_by_id", {}) if self.data else {}
+
+    @property
+    def devices_flat(self) -> list[tuple[str, dict[str, Any]]]:
+        """(account_number, device) pairs across every account."""
+        return self.data.get("devices_flat", []) if self.data else []
+
+    @property
+    def chargepoint_devices(self) -> list[tuple[str, dict[str, Any]]]:
+        """(account_number, device) pairs of the EV chargers across every account."""
+        return self.data.get("chargepoint_devices", []) if self.data else []
+
+    @property
+    def charger_id_by_account(self) -> dict[str, str]:
+        """Id of the first EV charger of each account that has one."""
+        return self.data.get("charger_id_by_account", {}) if self.data else {}
+
+    @property
+    def account_by_device_id(self) -> dict[str, str]:
+        """Account number owning each device, indexed by device id."""
+        return self.data.get("account_by_device_id", {}) if self.data else {}
+
+    @property
+    def device_name_by_id(self) -> dict[str, str | None]:
+        """Names of the devices that report one, indexed by device id."""
+        return self.data.get("device_name_by_id", {}) if self.data else {}
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data - EXACTLY following original pattern."""
         try:
@@ -57,9 +174,18 @@ class OctopusSpainDataUpdateCoordinator(DataUpdateCoordinator):
                 "agreement_prices": {},    # NEW: For tariff prices
                 "hourly_prices": {},       # NEW: For hourly pricing
                 "devices": {},
+                "devices_by_id": {},  # Flat device_id -> device index
+                "devices_flat": [],   # Flat (account_number, device) pairs
+                "chargepoint_devices": [],  # The SmartFlexChargePoint pairs of devices_flat
+                "charger_id_by_account": {},  # First charger id of each account
+                "account_by_device_id": {},
+                "device_name_by_id": {},
                 "planned_dispatches": {},
+                "planned_dispatches_formatted": {},  # Pre-formatted for sensors
                 "charge_history": {},
+                "last_sessions": {},  # Last charge session summary per charger
                 "device_preferences": {},
+                "snapshots": {},  # AccountSnapshot per account
             }
 
             # Fetch data for each account - simplified
@@ -69,6 +195,7 @@ class OctopusSpainDataUpdateCoordinator(DataUpdateCoordinator):
                     
                     # Get account info (ledgers)
                     account_data = await self.api.get_account_info(account_number)
+                    self._index_ledgers(account_data)
                     data["accounts"][account_number] = account_data
                     
                     # Get billing info for invoices (from original repo pattern)
@@ -166,7 +293,7 @@ class OctopusSpainDataUpdateCoordinator(DataUpdateCoordinator):
                         device_id = device.get("id")
                         device_name = device.get("name", "Unknown")
                         device_type = device.get("__typename")
-                        current_state = device.get("status", {}).get("currentState")
+                        current_state = device_current_state(device)
                         
                         if device_type == "SmartFlexChargePoint":
                             _LOGGER.debug("Processing charger %s (ID: %s, State: %s)", 
@@ -177,44 +304,53 @@ class OctopusSpainDataUpdateCoordinator(DataUpdateCoordinator):
                             data["charge_history"][device_id] = []
                             data["device_preferences"][device_id] = {}
                             
+                            # Preferences, planned dispatches and charge history are independent
+                            # queries: issue them together and handle each outcome on its own
+                            preferences, dispatches, history = await asyncio.gather(
+                                self.api.get_device_preferences(account_number, device_id),
+                                self.api.get_planned_dispatches(device_id),
+                                self.api.get_charge_history(account_number, device_id, 3),
+                                return_exceptions=True,
+                            )
+                            
                             # Get preferences (always available)
-                            try:
-                                preferences = await self.api.get_device_preferences(account_number, device_id)
+                            if isinstance(preferences, Exception):
+                                _LOGGER.warning("Failed to get preferences for %s: %s", device_name, preferences)
+                            else:
                                 data["device_preferences"][device_id] = preferences
                                 _LOGGER.debug("Got preferences for charger %s", device_name)
-                            except Exception as err:
-                                _LOGGER.warning("Failed to get preferences for %s: %s", device_name, err)
                             
                             # Get planned dispatches - ALWAYS try to get them, don't depend on state
-                            try:
-                                dispatches = await self.api.get_planned_dispatches(device_id)
+                            if isinstance(dispatches, Exception):
+                                _LOGGER.warning("Failed to get planned dispatches for %s: %s", device_name, dispatches)
+                            else:
                                 data["planned_dispatches"][device_id] = dispatches
                                 _LOGGER.debug("Got %d planned dispatches for %s", len(dispatches), device_name)
-                            except Exception as err:
-                                _LOGGER.warning("Failed to get planned dispatches for %s: %s", device_name, err)
-                                data["planned_dispatches"][device_id] = []
+                            data["planned_dispatches_formatted"][device_id] = self._format_planned_dispatches(
+                                data["planned_dispatches"][device_id]
+                            )
                             
                             # Get charge history - ALWAYS try to get it (should always be available)
-                            try:
-                                history = await self.api.get_charge_history(account_number, device_id, 3)
+                            if isinstance(history, Exception):
+                                if "KT-CT-7899" in str(history):
+                                    _LOGGER.debug("No charge history for %s (device may be new or no sessions yet)", device_name)
+                                else:
+                                    _LOGGER.warning("Failed to get charge history for %s: %s", device_name, history)
+                            else:
                                 data["charge_history"][device_id] = history
                                 if history and len(history) > 0:
-                                    sessions = history[0].get("chargePointChargingSession", {}).get("edges", [])
+                                    sessions = _session_edges(history)
                                     _LOGGER.debug("Got %d charge sessions for %s", len(sessions), device_name)
                                 else:
                                     _LOGGER.debug("No charge history returned for %s", device_name)
-                            except Exception as err:
-                                if "KT-CT-7899" in str(err):
-                                    _LOGGER.debug("No charge history for %s (device may be new or no sessions yet)", device_name)
-                                    data["charge_history"][device_id] = []
-                                else:
-                                    _LOGGER.warning("Failed to get charge history for %s: %s", device_name, err)
-                                    data["charge_history"][device_id] = []
+                            data["last_sessions"][device_id] = self._summarize_last_session(
+                                data["charge_history"][device_id]
+                            )
 
                 except Exception as err:
                     _LOGGER.error("Failed to fetch data for account %s: %s", account_number, err)
                     # Set default empty data for failed account
-                    data["accounts"][account_number] = {"ledgers": []}
+                    data["accounts"][account_number] = {"ledgers": [], "ledgers_by_type": {}}
                     data["devices"][account_number] = []
                     data["account_properties"][account_number] = {}
                     data["property_meters"][account_number] = {}
@@ -222,6 +358,9 @@ class OctopusSpainDataUpdateCoordinator(DataUpdateCoordinator):
                     data["agreement_prices"][account_number] = {}
                     data["hourly_prices"][account_number] = {"today": [], "tomorrow": []}
 
+                data["snapshots"][account_number] = self._build_account_snapshot(data, account_number)
+
+            self._index_devices(data)
             _LOGGER.info("Data update completed for %d accounts", len(self.accounts))
             return data
 
@@ -252,29 +391,28 @@ class OctopusSpainDataUpdateCoordinator(DataUpdateCoordinator):
             if not login_success:
                 raise Exception("Login failed for device refresh")
                 
-            # Get updated device data
-            devices = await self.api.get_devices_with_states(account)
+            known_device = self.devices_by_id.get(device_id)
+            is_charger = known_device is not None and known_device.get("__typename") == "SmartFlexChargePoint"
+            
+            # Get updated device data, and for chargers the planned dispatches alongside it:
+            # they only need the device id, so there is no reason to wait for the states first
+            if is_charger:
+                devices, dispatches = await asyncio.gather(
+                    self.api.get_devices_with_states(account),
+                    self._async_refresh_planned_dispatches(device_id, known_device.get("name", "Unknown")),
+                )
+            else:
+                devices = await self.api.get_devices_with_states(account)
             
             # Update the device in current data
             if hasattr(self, 'data') and self.data:
                 self.data["devices"][account] = devices
+                self._index_devices(self.data)
                 
-                # Update extended data for this device if it's a charger
-                for device in devices:
-                    if device.get("id") == device_id and device.get("__typename") == "SmartFlexChargePoint":
-                        device_name = device.get("name", "Unknown")
-                        current_state = device.get("status", {}).get("currentState")
-                        
-                        # ALWAYS update planned dispatches, don't depend on connection state
-                        try:
-                            dispatches = await self.api.get_planned_dispatches(device_id)
-                            self.data["planned_dispatches"][device_id] = dispatches
-                            _LOGGER.info("Refreshed %d planned dispatches for %s", len(dispatches), device_name)
-                        except Exception as err:
-                            _LOGGER.warning("Failed to refresh planned dispatches for %s: %s", device_name, err)
-                            self.data["planned_dispatches"][device_id] = []
-                        
-                        break
+                # ALWAYS update planned dispatches for chargers, don't depend on connection state
+                if is_charger:
+                    self.data["planned_dispatches"][device_id] = dispatches
+                    self.data["planned_dispatches_formatted"][device_id] = self._format_planned_dispatches(dispatches)
                 
                 self.async_update_listeners()
             else:
@@ -284,13 +422,80 @@ class OctopusSpainDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Failed to refresh device %s: %s", device_id, err)
             raise
 
+    async def async_request_device_refresh(self, device_id: str) -> None:
+        """Refresh a device once the API has applied a change, coalescing rapid changes."""
+        if device_id in self._device_refreshes_running:
+            # Too late for the refresh under way; run one more once it is done
+            self._device_refreshes_pending.add(device_id)
+        elif device_id not in self._device_refresh_timers:
+            self._schedule_device_refresh(device_id)
+
+    @callback
+    def _schedule_device_refresh(self, device_id: str) -> None:
+        """Refresh a device after the API has had time to apply a change."""
+        self._device_refresh_timers[device_id] = async_call_later(
+            self.hass, DEVICE_REFRESH_COOLDOWN, partial(self._async_run_device_refresh, device_id)
+        )
+
+    async def _async_run_device_refresh(self, device_id: str, _now: datetime) -> None:
+        """Run a scheduled device refresh, then the one asked for while it ran."""
+        self._device_refresh_timers.pop(device_id, None)
+        self._device_refreshes_running.add(device_id)
+        try:
+            await self.async_refresh_specific_device(device_id)
+        except Exception:  # already logged by async_refresh_specific_device
+            pass
+        finally:
+            self._device_refreshes_running.discard(device_id)
+
+        if device_id in self._device_refreshes_pending:
+            self._device_refreshes_pending.discard(device_id)
+            self._schedule_device_refresh(device_id)
+
+    @callback
+    def async_store_device_preferences(self, device_id: str, device: dict[str, Any]) -> None:
+        """Keep the preferences the API just accepted and show them right away."""
+        # The mutation answers with the same shape as get_device_preferences,
+        # and device refreshes do not fetch preferences again
+        if self.data and device:
+            self.data["device_preferences"][device_id] = device
+            self.async_update_listeners()
+
+    @callback
+    def async_store_device_state(self, device_id: str, state: str) -> None:
+        """Record the state a device was just switched to and show it right away."""
+        device = self.devices_by_id.get(device_id)
+        if device is None:
+            return
+        # Every entity of the device reads the shared record, so they all follow;
+        # the next device refresh overwrites it with what the API reports
+        status = device.get("status")
+        if status is None:
+            status = device["status"] = {}
+        status["currentState"] = state
+        self.async_update_listeners()
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending device refreshes before shutting down."""
+        for cancel in self._device_refresh_timers.values():
+            cancel()
+        self._device_refresh_timers.clear()
+        self._device_refreshes_pending.clear()
+        await super().async_shutdown()
+
+    async def _async_refresh_planned_dispatches(self, device_id: str, device_name: str) -> list[dict[str, Any]]:
+        """Fetch a charger's planned dispatches, falling back to none on failure."""
+        try:
+            dispatches = await self.api.get_planned_dispatches(device_id)
+        except Exception as err:
+            _LOGGER.warning("Failed to refresh planned dispatches for %s: %s", device_name, err)
+            return []
+        _LOGGER.info("Refreshed %d planned dispatches for %s", len(dispatches), device_name)
+        return dispatches
+
     async def async_get_device_data(self, device_id: str) -> dict | None:
         """Get data for a specific device."""
-        for account_devices in self.data.get("devices", {}).values():
-            for device in account_devices:
-                if device.get("id") == device_id:
-                    return device
-        return None
+        return self.devices_by_id.get(device_id)
 
     async def async_get_device_state(self, device_id: str) -> dict | None:
         """Get state for a specific device."""
@@ -299,29 +504,198 @@ class OctopusSpainDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_get_account_for_device(self, device_id: str) -> str | None:
         """Get the account number for a specific device."""
-        for account_number, devices in self.data.get("devices", {}).items():
-            for device in devices:
-                if device.get("id") == device_id:
-                    return account_number
-        return None
+        return self.account_by_device_id.get(device_id)
 
     def has_charge_history(self, device_id: str) -> bool:
         """Check if device has charge history."""
-        history_data = self.data.get("charge_history", {}).get(device_id, [])
-        if history_data and len(history_data) > 0:
-            sessions = history_data[0].get("chargePointChargingSession", {}).get("edges", [])
-            return len(sessions) > 0
-        return False
+        # The last session summary only exists when the history has at least one session
+        return self.data.get("last_sessions", {}).get(device_id) is not None
 
     def get_planned_dispatches_count(self, device_id: str) -> int:
         """Get number of planned dispatches for device."""
         dispatches = self.data.get("planned_dispatches", {}).get(device_id, [])
         return len(dispatches)
 
+    def _build_account_snapshot(self, data: dict[str, Any], account_number: str) -> AccountSnapshot:
+        """Flatten the nested account payloads into an AccountSnapshot."""
+        properties = data["account_properties"].get(account_number, {}).get("properties")
+        electricity_points = data["property_meters"].get(account_number, {}).get("electricitySupplyPoints")
+        active_agreement = data["electricity_agreements"].get(account_number, {}).get("activeAgreement") or {}
+        
+        def agreement_date(key: str) -> date | None:
+            value = active_agreement.get(key)
+            if value:
+                try:
+                    return parse_iso(value).date()
+                except ValueError:
+                    pass
+            return None
+        
+        return AccountSnapshot(
+            contract_number=data["account_properties"].get(account_number, {}).get("number"),
+            address=properties[0].get("address") if properties else None,
+            cups=electricity_points[0].get("cups") if electricity_points else None,
+            contract_type=active_agreement.get("product", {}).get("displayName") if active_agreement else None,
+            valid_from=agreement_date("validFrom"),
+            valid_to=agreement_date("validTo"),
+            ledgers_by_type=data["accounts"].get(account_number, {}).get("ledgers_by_type", {}),
+        )
+
+    def _index_devices(self, data: dict[str, Any]) -> None:
+        """Rebuild the flat device views from the per-account device lists."""
+        data["devices_flat"] = [
+            (account_number, device)
+            for account_number, devices in data["devices"].items()
+            for device in devices
+        ]
+        # Every entity compares these against the same literals on each update, and
+        # the type/provider values repeat across devices and refreshes
+        for _, device in data["devices_flat"]:
+            for key in _INTERNED_DEVICE_KEYS:
+                value = device.get(key)
+                if isinstance(value, str):
+                    device[key] = sys.intern(value)
+            status = device.get("status")
+            if status and isinstance(status.get("currentState"), str):
+                status["currentState"] = sys.intern(status["currentState"])
+        data["chargepoint_devices"] = [
+            pair for pair in data["devices_flat"] if pair[1].get("__typename") == DEVICE_TYPE_CHARGEPOINT
+        ]
+        charger_id_by_account: dict[str, str] = {}
+        for account_number, device in data["chargepoint_devices"]:
+            charger_id_by_account.setdefault(account_number, device.get("id"))
+        data["charger_id_by_account"] = charger_id_by_account
+        data["devices_by_id"] = {device.get("id"): device for _, device in data["devices_flat"]}
+        data["account_by_device_id"] = {device.get("id"): account for account, device in data["devices_flat"]}
+        data["device_name_by_id"] = {
+            device.get("id"): device["name"] for _, device in data["devices_flat"] if "name" in device
+        }
+
+    def _index_ledgers(self, account_data: dict[str, Any]) -> None:
+        """Index ledgers by type and precompute balances in euros."""
+        ledgers_by_type = {}
+        for ledger in account_data.get("ledgers", []):
+            # Balance is in cents, convert to euros
+            balance = ledger.get("balance")
+            ledger["balance_eur"] = float(balance) / 100 if balance is not None else None
+            ledger_type = ledger["ledgerType"] = sys.intern(ledger["ledgerType"])
+            ledgers_by_type[ledger_type] = ledger
+        account_data["ledgers_by_type"] = ledgers_by_type
+        
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            skipped = ledgers_by_type.keys() - {ELECTRICITY_LEDGER, SOLAR_WALLET_LEDGER}
+            if skipped:
+                _LOGGER.debug("Skipping ledger types: %s (not electricity/solar)", ", ".join(sorted(skipped)))
+
+    def _format_planned_dispatches(self, dispatches: list[dict[str, Any]]) -> dict[str, Any]:
+        """Parse and format planned dispatches once per refresh for the sensors.
+
+        Dispatches without a parseable start/end are dropped here so the
+        sensors only ever see well-formed entries, and the rest are sorted by
+        start since the API does not document an order.
+        """
+        parsed = []
+        dropped = 0
+        
+        for dispatch in dispatches:
+            try:
+                parsed.append((parse_iso(dispatch["start"]), parse_iso(dispatch["end"]), dispatch))
+            except (KeyError, TypeError, ValueError):
+                dropped += 1
+        
+        if dropped:
+            _LOGGER.warning("Dropped %d malformed planned dispatches", dropped)
+        
+        parsed.sort(key=itemgetter(0))
+        
+        valid = []
+        starts = []
+        ends = []
+        durations_s = []
+        time_ranges = []
+        rich = []
+        sessions = []
+        
+        for start_dt, end_dt, dispatch in parsed:
+            duration = int((end_dt - start_dt).total_seconds())
+            valid.append(dispatch)
+            starts.append(start_dt)
+            ends.append(end_dt)
+            durations_s.append(duration)
+            
+            # Format as HH:MM-HH:MM
+            start_hm = f"{start_dt.hour:02d}:{start_dt.minute:02d}"
+            end_hm = f"{end_dt.hour:02d}:{end_dt.minute:02d}"
+            time_ranges.append(f"{start_hm}-{end_hm}")
+            rich.append({
+                "start": start_dt.strftime("%Y-%m-%d %H:%M"),
+                "end": end_dt.strftime("%Y-%m-%d %H:%M"),
+                "duration_hours": _round_hours(duration, 1),
+                "type": dispatch.get("type")
+            })
+            # Plain tuples; the sensor only expands them into dicts on update
+            sessions.append((
+                dispatch["start"], dispatch["end"], start_hm, end_hm, duration, dispatch.get("type", "SMART")
+            ))
+        
+        if not time_ranges:
+            summary = "No scheduled sessions"
+        elif len(time_ranges) == 1:
+            summary = f"1 session: {time_ranges[0]}"
+        else:
+            summary = f"{len(time_ranges)} sessions: {', '.join(time_ranges)}"
+        
+        return {
+            # Parallel per-dispatch columns, aligned with "dispatches"
+            "dispatches": valid,
+            "starts": starts,
+            "ends": ends,
+            "durations_s": durations_s,
+            "total_hours": _round_hours(sum(durations_s), 2),
+            # Sorted above, so these match the first/last entries sensors read
+            "first_start": starts[0] if starts else None,
+            "last_end": ends[-1] if ends else None,
+            "time_ranges": time_ranges,
+            "rich": rich,
+            # (start, end, start_hm, end_hm, duration_s, type) per dispatch
+            "sessions": sessions,
+            "summary": summary,
+        }
+
+    def _summarize_last_session(self, history: list[dict[str, Any]]) -> dict[str, Any] | None:
+        """Flatten the most recent charge session once per refresh for the sensors."""
+        sessions = _session_edges(history)
+        if not sessions:
+            return None
+        session = sessions[0]["node"]
+        
+        start = end = duration = None
+        try:
+            if session.get("start"):
+                start = parse_iso(session["start"])
+            if session.get("end"):
+                end = parse_iso(session["end"])
+        except ValueError:
+            _LOGGER.debug("Unparseable last session times: %s - %s", session.get("start"), session.get("end"))
+        if start and end:
+            duration = _round_hours(int((end - start).total_seconds()), 1)
+        
+        # A bad value only blanks its own field, not the whole account refresh
+        energy = _optional_float((session.get("energyAdded") or {}).get("value"))
+        cost = _optional_float((session.get("cost") or {}).get("amount"))
+        return {
+            "start_raw": session.get("start"),
+            "end_raw": session.get("end"),
+            "start": start,
+            "end": end,
+            "duration_h": duration,
+            "energy_kwh": energy,
+            "cost_eur": cost,
+            "type": session.get("type"),
+        }
+
     def _process_billing_data(self, billing_data: dict) -> dict:
         """Process billing data to extract invoice info - FROM ORIGINAL REPO."""
-        from datetime import datetime, timedelta
-        
         ledgers = billing_data.get("ledgers", [])
         
         # Find electricity ledger with invoice data
@@ -348,6 +722,8 @@ class OctopusSpainDataUpdateCoordinator(DataUpdateCoordinator):
         
         # Get the most recent invoice
         invoice = statements[0]["node"]
+        # Coerce once so sensors can expose the amount as-is
+        amount = float(invoice.get("amount") or 0)
         
         try:
             # Process dates following original pattern
@@ -356,19 +732,19 @@ class OctopusSpainDataUpdateCoordinator(DataUpdateCoordinator):
             end_date = None
             
             if invoice.get("issuedDate"):
-                issued_date = datetime.fromisoformat(invoice["issuedDate"]).date()
+                issued_date = parse_iso(invoice["issuedDate"]).date()
             
             if invoice.get("consumptionStartDate"):
                 # Original adds 2 hours (timezone adjustment)
-                start_date = (datetime.fromisoformat(invoice["consumptionStartDate"]) + timedelta(hours=2)).date()
+                start_date = (parse_iso(invoice["consumptionStartDate"]) + timedelta(hours=2)).date()
             
             if invoice.get("consumptionEndDate"):
                 # Original subtracts 1 second 
-                end_date = (datetime.fromisoformat(invoice["consumptionEndDate"]) - timedelta(seconds=1)).date()
+                end_date = (parse_iso(invoice["consumptionEndDate"]) - timedelta(seconds=1)).date()
             
             return {
                 "last_invoice": {
-                    "amount": invoice["amount"] if invoice.get("amount") else 0,
+                    "amount": amount,
                     "issued": issued_date,
                     "start": start_date,
                     "end": end_date,
@@ -379,7 +755,7 @@ class OctopusSpainDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.warning("Failed to process invoice dates: %s", err)
             return {
                 "last_invoice": {
-                    "amount": invoice.get("amount", 0),
+                    "amount": amount,
                     "issued": None,
                     "start": None,
                     "end": None,
@@ -410,41 +786,29 @@ class OctopusSpainDataUpdateCoordinator(DataUpdateCoordinator):
         today = datetime.now(tz).date()
         tomorrow = today + timedelta(days=1)
         
-        today_prices = []
-        tomorrow_prices = []
+        half_hour = timedelta(minutes=30)
         
-        # Generate prices for today and tomorrow
-        for target_date in [today, tomorrow]:
-            prices_for_day = []
-            
-            # Generate 30-minute intervals for the full day
-            current_dt = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=tz)
-            end_of_day = current_dt + timedelta(days=1)
-            
-            while current_dt < end_of_day:
-                interval_end = current_dt + timedelta(minutes=30)
-                
-                # Determine price based on Spanish tariff rules
-                price = self._get_spanish_tariff_price(current_dt, price_peak, price_standard, price_valley)
-                
-                price_entry = {
-                    "start": current_dt.isoformat(),
-                    "end": interval_end.isoformat(), 
-                    "value": price
-                }
-                
-                prices_for_day.append(price_entry)
-                current_dt = interval_end
-            
-            # Add to appropriate day
-            if target_date == today:
-                today_prices = prices_for_day
-            else:
-                tomorrow_prices = prices_for_day
+        def prices_for_day(target_date: date) -> list[dict[str, Any]]:
+            """Build the 48 half-hour intervals of one day."""
+            start_of_day = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=tz)
+            # The price only depends on the weekday and the hour, resolve each hour once
+            hourly = [
+                self._get_spanish_tariff_price(start_of_day.replace(hour=hour), price_peak, price_standard, price_valley)
+                for hour in range(24)
+            ]
+            # Each boundary is the end of one interval and the start of the next, format it once
+            bounds = [start_of_day + half_hour * step for step in range(49)]
+            stamps = [bound.isoformat() for bound in bounds]
+            return [
+                {"start": stamps[step], "end": stamps[step + 1], "value": hourly[bounds[step].hour]}
+                for step in range(48)
+            ]
         
         return {
-            "today": today_prices,
-            "tomorrow": tomorrow_prices
+            "today": prices_for_day(today),
+            "tomorrow": prices_for_day(tomorrow),
+            # Parsed once so the price sensors can fall back without re-reading the tariff
+            "rates": (price_peak, price_standard, price_valley),
         }
     
     def _get_spanish_tariff_price(self, dt: datetime, price_peak: float, price_standard: float, price_valley: float) -> float:
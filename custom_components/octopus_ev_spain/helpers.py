@@ -0,0 +1,51 @@
+"""Shared helpers for the Octopus Energy Spain entity platforms."""
+from __future__ import annotations
+
+from functools import lru_cache
+import sys
+from typing import Any
+
+from .const import DOMAIN, MANUFACTURER
+
+
+def safe_device_info(device_id: str, device: dict[str, Any] | None) -> dict[str, Any]:
+    """Safely create device info for a device record, which may be missing."""
+    if not device:
+        return {
+            "identifiers": {(DOMAIN, device_id)},
+            "name": "Dispositivo Desconocido",
+            "manufacturer": MANUFACTURER,
+            "model": "Desconocido",
+        }
+
+    return _build_device_info(
+        device_id,
+        device.get("name", "Dispositivo Desconocido"),
+        device.get("__typename", "Desconocido"),
+        device.get("provider", "Desconocido"),
+        device.get("deviceType", "Desconocido"),
+    )
+
+
+def device_current_state(device: dict[str, Any] | None) -> str | None:
+    """Return the current state a device reports, or None when it reports none."""
+    status = device.get("status") if device else None
+    return status.get("currentState") if status else None
+
+
+@lru_cache(maxsize=256)
+def _build_device_info(
+    device_id: str,
+    name: str | None,
+    typename: str | None,
+    provider: str | None,
+    device_type: str | None,
+) -> dict[str, Any]:
+    """Build device info once per distinct device identity."""
+    return {
+        "identifiers": {(DOMAIN, sys.intern(device_id))},
+        "name": sys.intern(name) if name else name,
+        "manufacturer": MANUFACTURER,
+        "model": sys.intern(f"{typename} ({provider})"),
+        "sw_version": device_type,
+    }
@@ -1,22 +1,25 @@
 """Number platform for Octopus Energy Spain - SIMPLIFIED."""
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, DEFAULT_MAX_PERCENTAGE, DAYS_OF_WEEK
 from .coordinator import OctopusSpainDataUpdateCoordinator
+from .helpers import safe_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+# Send one charger change at a time to the Octopus API
+PARALLEL_UPDATES = 1
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,42 +29,25 @@ async def async_setup_entry(
     """Set up Octopus Energy Spain number entities."""
     coordinator: OctopusSpainDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[NumberEntity] = []
-
     # Add max percentage configuration for each charger
-    for account_number, devices in coordinator.data.get("devices", {}).items():
-        for device in devices:
-            if device.get("__typename") == "SmartFlexChargePoint":
-                device_id = device["id"]
-                entities.append(
-                    OctopusChargerMaxPercentageNumber(coordinator, account_number, device_id)
-                )
-
-    async_add_entities(entities)
-
-
-def _safe_device_info(device_id: str, device: dict[str, Any] | None) -> dict[str, Any]:
-    """Safely create device info."""
-    if not device:
-        return {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": "Dispositivo Desconocido",
-            "manufacturer": "Lockevod",
-            "model": "Desconocido",
-        }
-        
-    return {
-        "identifiers": {(DOMAIN, device_id)},
-        "name": device.get("name", "Dispositivo Desconocido"),
-        "manufacturer": "Lockevod",
-        "model": f"{device.get('__typename', 'Desconocido')} ({device.get('provider', 'Desconocido')})",
-        "sw_version": device.get("deviceType", "Desconocido"),
-    }
+    async_add_entities([
+        OctopusChargerMaxPercentageNumber(coordinator, account_number, device["id"])
+        for account_number, device in coordinator.chargepoint_devices
+    ])
 
 
 class OctopusChargerMaxPercentageNumber(CoordinatorEntity, NumberEntity):
     """Number entity for charger max percentage configuration."""
 
+    __slots__ = ()
+
+    _attr_translation_key = "max_percentage"
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_native_min_value = 10
+    _attr_native_max_value = 100
+    _attr_native_step = 5
+    _attr_icon = "mdi:battery-charging-90"
+
     def __init__(
         self,
         coordinator: OctopusSpainDataUpdateCoordinator,
@@ -73,59 +59,54 @@ class OctopusChargerMaxPercentageNumber(CoordinatorEntity, NumberEntity):
         self._account_number = account_number
         self._device_id = device_id
         
-        device = self._get_device_data()
+        self._device = device = self._get_device_data()
+        self._attr_device_info = safe_device_info(device_id, device)
         device_name = device.get("name", "Charger") if device else "Charger"
         self._attr_name = f"{device_name} Max Percentage"
         self._attr_unique_id = f"octopus_{device_id}_12_max_percentage"  # Updated from 09_
-        self._attr_translation_key = "max_percentage"  # Use translation key
-            
-        self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_native_min_value = 10
-        self._attr_native_max_value = 100
-        self._attr_native_step = 5
-        self._attr_icon = "mdi:battery-charging-90"
+        self._update_cached_state()
 
     def _get_device_data(self) -> dict[str, Any] | None:
         """Get device data from coordinator."""
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            _LOGGER.warning("Failed to get device data for %s", self._device_id)
-        return None
+        return self.coordinator.devices_by_id.get(self._device_id)
 
     def _get_preferences(self) -> dict[str, Any] | None:
         """Get device preferences."""
-        try:
-            preferences_data = self.coordinator.data.get("device_preferences", {}).get(self._device_id, {})
-            # Check structure
-            if isinstance(preferences_data, dict) and "preferences" in preferences_data:
-                return preferences_data["preferences"]
-            elif isinstance(preferences_data, dict) and "schedules" in preferences_data:
-                return preferences_data
-        except (KeyError, TypeError, AttributeError):
-            pass
+        data = self.coordinator.data
+        preferences_data = data.get("device_preferences", {}).get(self._device_id) if data else None
+        if not isinstance(preferences_data, dict):
+            return None
+        # Check structure
+        if "preferences" in preferences_data:
+            return preferences_data["preferences"]
+        if "schedules" in preferences_data:
+            return preferences_data
         return None
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current max percentage."""
-        preferences = self._get_preferences()
-        if preferences:
-            schedules = preferences.get("schedules", [])
-            if schedules:
-                max_value = schedules[0].get("max")
-                return float(max_value) if max_value else DEFAULT_MAX_PERCENTAGE
-        return DEFAULT_MAX_PERCENTAGE
+    def _update_cached_state(self) -> None:
+        """Snapshot the device, its preferences and the derived state once per coordinator refresh."""
+        device = self._get_device_data()
+        if device is not self._device:
+            # Only rebuilt when the coordinator replaced the device record
+            self._attr_device_info = safe_device_info(self._device_id, device)
+            self._device = device
+        self._preferences = preferences = self._get_preferences()
+        schedules = preferences.get("schedules") if preferences else None
+        max_value = schedules[0].get("max") if schedules else None
+        self._attr_native_value = float(max_value) if max_value else DEFAULT_MAX_PERCENTAGE
+        self._attr_extra_state_attributes = self._build_attrs(preferences)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         # Max percentage should always be available if preferences exist
-        preferences = self._get_preferences()
-        if preferences is None:
+        if self._preferences is None:
             _LOGGER.debug("Max percentage unavailable for %s: no preferences", self._device_id)
             return False
         return True
@@ -159,18 +140,16 @@ class OctopusChargerMaxPercentageNumber(CoordinatorEntity, NumberEntity):
                 _LOGGER.warning("No preferences found, using default time")
             
             # Create new schedules with updated max percentage but preserved time
-            schedules = []
-            for day in DAYS_OF_WEEK:
-                schedules.append({
-                    "dayOfWeek": day,
-                    "time": current_time,
-                    "max": float(value)
-                })
+            max_value = float(value)
+            schedules = [
+                {"dayOfWeek": day, "time": current_time, "max": max_value}
+                for day in DAYS_OF_WEEK
+            ]
             
             _LOGGER.debug("Updating preferences with time=%s, max=%s%%", current_time, value)
             
             # Update preferences
-            await self.coordinator.api.set_smart_flex_device_preferences(
+            updated = await self.coordinator.api.set_smart_flex_device_preferences(
                 device_id=self._device_id,
                 mode="CHARGE",
                 unit="PERCENTAGE",
@@ -179,35 +158,29 @@ class OctopusChargerMaxPercentageNumber(CoordinatorEntity, NumberEntity):
             
             _LOGGER.info("Successfully updated max percentage for %s to %s%%", device_name, value)
             
-            # Refresh data
-            await asyncio.sleep(2)
-            await self.coordinator.async_refresh_specific_device(self._device_id)
+            # Show the accepted preferences now; the refresh only confirms them
+            self.coordinator.async_store_device_preferences(self._device_id, updated)
+            await self.coordinator.async_request_device_refresh(self._device_id)
             
-            # FIXED: Send notification using persistent_notification.create
-            await self.hass.services.async_call(
-                "persistent_notification",
-                "create",
-                {
-                    "title": f"🔋 {device_name}",
-                    "message": f"Porcentaje máximo actualizado a {value}%",
-                    "notification_id": f"charger_max_percentage_{self._device_id}",
-                },
+            # FIXED: Send notification using persistent_notification.create, without holding up the write
+            self.hass.async_create_task(
+                self.hass.services.async_call(
+                    "persistent_notification",
+                    "create",
+                    {
+                        "title": f"🔋 {device_name}",
+                        "message": f"Porcentaje máximo actualizado a {value}%",
+                        "notification_id": f"charger_max_percentage_{self._device_id}",
+                    },
+                )
             )
             
         except Exception as err:
             _LOGGER.error("Failed to set max percentage for device %s: %s", self._device_id, err)
             raise
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        preferences = self._get_preferences()
+    def _build_attrs(self, preferences: dict[str, Any] | None) -> dict[str, Any]:
+        """Build the extra attributes for a preferences snapshot."""
         attrs = {"device_id": self._device_id}
         
         if preferences:
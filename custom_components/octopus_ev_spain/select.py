@@ -1,21 +1,24 @@
 """Select platform for Octopus Energy Spain - HORA OBJETIVO COMO DESPLEGABLE."""
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, DEFAULT_MAX_PERCENTAGE, DAYS_OF_WEEK, VALID_TIME_OPTIONS
 from .coordinator import OctopusSpainDataUpdateCoordinator
+from .helpers import safe_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+# Send one charger change at a time to the Octopus API
+PARALLEL_UPDATES = 1
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -25,42 +28,22 @@ async def async_setup_entry(
     """Set up Octopus Energy Spain select entities."""
     coordinator: OctopusSpainDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[SelectEntity] = []
-
     # Add time select entities for each charger
-    for account_number, devices in coordinator.data.get("devices", {}).items():
-        for device in devices:
-            if device.get("__typename") == "SmartFlexChargePoint":
-                device_id = device["id"]
-                entities.append(
-                    OctopusChargerTargetTimeSelect(coordinator, account_number, device_id)
-                )
-
-    async_add_entities(entities)
-
-
-def _safe_device_info(device_id: str, device: dict[str, Any] | None) -> dict[str, Any]:
-    """Safely create device info."""
-    if not device:
-        return {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": "Dispositivo Desconocido",
-            "manufacturer": "Lockevod",
-            "model": "Desconocido",
-        }
-        
-    return {
-        "identifiers": {(DOMAIN, device_id)},
-        "name": device.get("name", "Dispositivo Desconocido"),
-        "manufacturer": "Lockevod",
-        "model": f"{device.get('__typename', 'Desconocido')} ({device.get('provider', 'Desconocido')})",
-        "sw_version": device.get("deviceType", "Desconocido"),
-    }
+    async_add_entities([
+        OctopusChargerTargetTimeSelect(coordinator, account_number, device["id"])
+        for account_number, device in coordinator.chargepoint_devices
+    ])
 
 
 class OctopusChargerTargetTimeSelect(CoordinatorEntity, SelectEntity):
     """Select entity for charger target time configuration - DROPDOWN."""
 
+    __slots__ = ()
+
+    _attr_translation_key = "target_time"
+    _attr_icon = "mdi:clock-time-four"
+    _attr_options = VALID_TIME_OPTIONS
+
     def __init__(
         self,
         coordinator: OctopusSpainDataUpdateCoordinator,
@@ -72,42 +55,49 @@ class OctopusChargerTargetTimeSelect(CoordinatorEntity, SelectEntity):
         self._account_number = account_number
         self._device_id = device_id
         
-        device = self._get_device_data()
+        self._device = device = self._get_device_data()
+        self._attr_device_info = safe_device_info(device_id, device)
         device_name = device.get("name", "Charger") if device else "Charger"
         self._attr_name = f"{device_name} Target Time"
         self._attr_unique_id = f"octopus_{device_id}_13_target_time"  # Updated from 10_
-        self._attr_translation_key = "target_time"  # Use translation key
-        self._attr_icon = "mdi:clock-time-four"
-        self._attr_options = VALID_TIME_OPTIONS
+        self._update_cached_state()
 
     def _get_device_data(self) -> dict[str, Any] | None:
         """Get device data from coordinator."""
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            _LOGGER.warning("Failed to get device data for %s", self._device_id)
-        return None
+        return self.coordinator.devices_by_id.get(self._device_id)
 
     def _get_preferences(self) -> dict[str, Any] | None:
         """Get device preferences."""
-        try:
-            preferences_data = self.coordinator.data.get("device_preferences", {}).get(self._device_id, {})
-            # Check structure
-            if isinstance(preferences_data, dict) and "preferences" in preferences_data:
-                return preferences_data["preferences"]
-            elif isinstance(preferences_data, dict) and "schedules" in preferences_data:
-                return preferences_data
-        except (KeyError, TypeError, AttributeError):
-            pass
+        data = self.coordinator.data
+        preferences_data = data.get("device_preferences", {}).get(self._device_id) if data else None
+        if not isinstance(preferences_data, dict):
+            return None
+        # Check structure
+        if "preferences" in preferences_data:
+            return preferences_data["preferences"]
+        if "schedules" in preferences_data:
+            return preferences_data
         return None
 
-    @property
-    def current_option(self) -> str | None:
-        """Return the current target time."""
-        preferences = self._get_preferences()
+    def _update_cached_state(self) -> None:
+        """Snapshot the device, its preferences and the derived state once per coordinator refresh."""
+        device = self._get_device_data()
+        if device is not self._device:
+            # Only rebuilt when the coordinator replaced the device record
+            self._attr_device_info = safe_device_info(self._device_id, device)
+            self._device = device
+        self._preferences = preferences = self._get_preferences()
+        self._attr_current_option = self._preferred_option(preferences)
+        self._attr_extra_state_attributes = self._build_attrs(preferences)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
+
+    def _preferred_option(self, preferences: dict[str, Any] | None) -> str:
+        """Return the target time option stored in the charger preferences."""
         if preferences:
             schedules = preferences.get("schedules", [])
             if schedules:
@@ -154,8 +144,7 @@ class OctopusChargerTargetTimeSelect(CoordinatorEntity, SelectEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        preferences = self._get_preferences()
-        if preferences is None:
+        if self._preferences is None:
             _LOGGER.debug("Target time unavailable for %s: no preferences", self._device_id)
             return False
         return True
@@ -175,7 +164,7 @@ class OctopusChargerTargetTimeSelect(CoordinatorEntity, SelectEntity):
             
             # Get current preferences to preserve max percentage
             preferences = self._get_preferences()
-            current_max = DEFAULT_MAX_PERCENTAGE  # Default fallback
+            current_max = float(DEFAULT_MAX_PERCENTAGE)  # Default fallback
             
             if preferences:
                 schedules = preferences.get("schedules", [])
@@ -193,18 +182,15 @@ class OctopusChargerTargetTimeSelect(CoordinatorEntity, SelectEntity):
                 _LOGGER.warning("No preferences found, using default max percentage")
             
             # Create new schedules for all days with preserved max percentage
-            schedules = []
-            for day in DAYS_OF_WEEK:
-                schedules.append({
-                    "dayOfWeek": day,
-                    "time": option,
-                    "max": float(current_max)
-                })
+            schedules = [
+                {"dayOfWeek": day, "time": option, "max": current_max}
+                for day in DAYS_OF_WEEK
+            ]
             
             _LOGGER.debug("Updating preferences with time=%s, max=%s%%", option, current_max)
             
             # Update preferences
-            await self.coordinator.api.set_smart_flex_device_preferences(
+            updated = await self.coordinator.api.set_smart_flex_device_preferences(
                 device_id=self._device_id,
                 mode="CHARGE",
                 unit="PERCENTAGE",
@@ -213,35 +199,29 @@ class OctopusChargerTargetTimeSelect(CoordinatorEntity, SelectEntity):
             
             _LOGGER.info("Successfully updated target time for %s to %s", device_name, option)
             
-            # Refresh data
-            await asyncio.sleep(2)
-            await self.coordinator.async_refresh_specific_device(self._device_id)
+            # Show the accepted preferences now; the refresh only confirms them
+            self.coordinator.async_store_device_preferences(self._device_id, updated)
+            await self.coordinator.async_request_device_refresh(self._device_id)
             
-            # Send notification
-            await self.hass.services.async_call(
-                "persistent_notification",
-                "create",
-                {
-                    "title": f"⏰ {device_name}",
-                    "message": f"Hora objetivo actualizada a {option}",
-                    "notification_id": f"charger_target_time_{self._device_id}",
-                },
+            # Send notification without holding up the write
+            self.hass.async_create_task(
+                self.hass.services.async_call(
+                    "persistent_notification",
+                    "create",
+                    {
+                        "title": f"⏰ {device_name}",
+                        "message": f"Hora objetivo actualizada a {option}",
+                        "notification_id": f"charger_target_time_{self._device_id}",
+                    },
+                )
             )
             
         except Exception as err:
             _LOGGER.error("Failed to set target time for device %s: %s", self._device_id, err)
             raise
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        preferences = self._get_preferences()
+    def _build_attrs(self, preferences: dict[str, Any] | None) -> dict[str, Any]:
+        """Build the extra attributes for a preferences snapshot."""
         attrs = {
             "device_id": self._device_id,
             "allowed_times": VALID_TIME_OPTIONS,
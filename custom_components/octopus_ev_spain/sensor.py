@@ -1,13 +1,17 @@
 """Sensor platform for Octopus Energy Spain - SIMPLIFIED for new structure."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 import logging
-from datetime import datetime, timedelta
-from typing import Any
+import sys
+from datetime import date, datetime, timedelta
+from operator import attrgetter
+from typing import Any, Callable, Iterator, NamedTuple
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -16,15 +20,43 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, ELECTRICITY_LEDGER, SOLAR_WALLET_LEDGER, LEDGER_NAMES
-from .coordinator import OctopusSpainDataUpdateCoordinator
+from .const import (
+    DOMAIN,
+    CONNECTED_STATES,
+    ELECTRICITY_LEDGER,
+    SOLAR_WALLET_LEDGER,
+    LEDGER_NAMES,
+    SENSOR_PREFIX_CONTRACT_NUMBER,
+    SENSOR_PREFIX_ADDRESS,
+    SENSOR_PREFIX_CUPS,
+    SENSOR_PREFIX_CONTRACT_TYPE,
+    SENSOR_PREFIX_CONTRACT_VALID_FROM,
+    SENSOR_PREFIX_CONTRACT_VALID_TO,
+    DEVICE_SENSOR_PREFIX_NEXT_SESSION_START,
+    DEVICE_SENSOR_PREFIX_NEXT_SESSION_END,
+    DEVICE_SENSOR_PREFIX_TOTAL_HOURS_TODAY,
+    DEVICE_SENSOR_PREFIX_LAST_SESSION_DATE,
+    DEVICE_SENSOR_PREFIX_LAST_SESSION_DURATION,
+    DEVICE_SENSOR_PREFIX_LAST_ENERGY_ADDED,
+    DEVICE_SENSOR_PREFIX_LAST_SESSION_COST,
+)
+from .coordinator import AccountSnapshot, OctopusSpainDataUpdateCoordinator, _round_hours
+from .helpers import device_current_state, safe_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+# Use English states - will be translated by HA
+STATE_TRANSLATIONS: dict[str, str] = {
+    "SMART_CONTROL_NOT_AVAILABLE": "disconnected",
+    "SMART_CONTROL_CAPABLE": "connected",
+    "BOOSTING": "boost_charging",
+    "SMART_CONTROL_IN_PROGRESS": "scheduled_charging",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -34,134 +66,156 @@ async def async_setup_entry(
     """Set up Octopus Energy Spain sensors."""
     coordinator: OctopusSpainDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[SensorEntity] = []
+    # One call for every sensor; a list is used as-is while other iterables get copied into one
+    async_add_entities(list(_iter_entities(coordinator)))
+
+
+def _iter_entities(coordinator: OctopusSpainDataUpdateCoordinator) -> Iterator[SensorEntity]:
+    """Yield all sensors for the coordinator data, in display order."""
+    # Only disambiguate sensor names by account when there is more than one
+    is_single_account = len(coordinator.accounts) == 1
 
     # Account-level sensors (ledger balances + invoices + contract info)
     for account_number in coordinator.accounts:
         account_data = coordinator.data.get("accounts", {}).get(account_number, {})
+        name_suffix = "" if is_single_account else f" ({account_number})"
         
         # Add NEW contract information sensors FIRST (in order requested)
-        properties_data = coordinator.data.get("account_properties", {}).get(account_number, {})
-        if properties_data:
-            entities.append(OctopusContractNumberSensor(coordinator, account_number))
-            if properties_data.get("properties"):
-                entities.append(OctopusAddressSensor(coordinator, account_number))
-        
-        # Add CUPS sensor if available
-        meters_data = coordinator.data.get("property_meters", {}).get(account_number, {})
-        if meters_data.get("electricitySupplyPoints"):
-            entities.append(OctopusCupsSensor(coordinator, account_number))
-        
-        # Add contract details sensors if available
-        agreement_data = coordinator.data.get("electricity_agreements", {}).get(account_number, {})
-        if agreement_data.get("activeAgreement"):
-            entities.append(OctopusContractTypeSensor(coordinator, account_number))
-            entities.append(OctopusContractValidFromSensor(coordinator, account_number))
-            entities.append(OctopusContractValidToSensor(coordinator, account_number))
+        for spec in ACCOUNT_INFO_SENSORS:
+            if spec.exists_fn(coordinator.data, account_number):
+                yield OctopusAccountInfoSensor(coordinator, account_number, spec, name_suffix)
         
         # Add existing ledger sensors - FILTER OUT GAS LEDGERS
-        for ledger in account_data.get("ledgers", []):
-            ledger_type = ledger.get("ledgerType")
-            # Only create sensors for electricity and solar wallet, NOT gas
-            if ledger_type in [ELECTRICITY_LEDGER, SOLAR_WALLET_LEDGER]:
-                entities.append(OctopusLedgerSensor(coordinator, account_number, ledger))
-            else:
-                _LOGGER.debug("Skipping ledger type: %s (not electricity/solar)", ledger_type)
+        ledgers_by_type = account_data.get("ledgers_by_type", {})
+        # Only create sensors for electricity and solar wallet, NOT gas
+        for ledger_type in (ELECTRICITY_LEDGER, SOLAR_WALLET_LEDGER):
+            ledger = ledgers_by_type.get(ledger_type)
+            if ledger is not None:
+                yield OctopusLedgerSensor(coordinator, account_number, ledger)
         
         # Add invoice sensor (from original repo)
         billing_data = coordinator.data.get("billing_info", {}).get(account_number, {})
         if billing_data.get("last_invoice") is not None:
-            entities.append(OctopusInvoiceSensor(coordinator, account_number))
+            yield OctopusInvoiceSensor(coordinator, account_number, name_suffix)
 
         # Add NEW pricing sensors if available
         agreement_prices = coordinator.data.get("agreement_prices", {}).get(account_number, {})
         hourly_prices = coordinator.data.get("hourly_prices", {}).get(account_number, {})
         if agreement_prices.get("product", {}).get("prices"):
-            entities.append(OctopusTariffPricesSensor(coordinator, account_number))
+            yield OctopusTariffPricesSensor(coordinator, account_number, name_suffix)
         if hourly_prices.get("today") or hourly_prices.get("tomorrow"):
-            entities.append(OctopusCurrentPriceSensor(coordinator, account_number))
-            entities.append(OctopusCurrentPriceEVSensor(coordinator, account_number))
+            yield OctopusCurrentPriceSensor(coordinator, account_number, name_suffix)
+            yield OctopusCurrentPriceEVSensor(coordinator, account_number, name_suffix)
 
     # Device sensors
-    for account_number, devices in coordinator.data.get("devices", {}).items():
-        for device in devices:
-            device_id = device["id"]
-            device_type = device.get("__typename")
-            
-            if device_type == "SmartFlexChargePoint":
-                # Add charger-specific sensors (order: contrato, dirección, estado, planificada, fecha, duración, energía, coste)
-                entities.extend([
-                    # NEW: Reference sensors for contract info in charger device (FIRST)
-                    OctopusChargerContractReferenceSensor(coordinator, account_number, device_id),
-                    OctopusChargerAddressReferenceSensor(coordinator, account_number, device_id),
-                    OctopusDeviceStateSensor(coordinator, account_number, device_id),
-                    OctopusChargerPlannedDispatchesSensor(coordinator, device_id),
-                    # NEW: Automation-friendly sensors for planned dispatches
-                    OctopusChargerNextSessionStartSensor(coordinator, device_id),
-                    OctopusChargerNextSessionEndSensor(coordinator, device_id),
-                    OctopusChargerTotalHoursTodaySensor(coordinator, device_id),
-                    # NEW: Date of last charge session
-                    OctopusChargerLastSessionDateSensor(coordinator, device_id),
-                    OctopusChargerLastSessionDurationSensor(coordinator, device_id),
-                    OctopusChargerLastEnergyAddedSensor(coordinator, device_id),
-                    OctopusChargerLastSessionCostSensor(coordinator, device_id),
-                    # REMOVED: OctopusChargerPreferencesSensor - no aporta valor según usuario
-                ])
-
-    async_add_entities(entities)
-
-
-def _safe_device_info(device_id: str, device: dict[str, Any] | None) -> dict[str, Any]:
-    """Safely create device info - FIXED."""
-    if not device:
-        return {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": "Dispositivo Desconocido",
-            "manufacturer": "Lockevod",
-            "model": "Desconocido",
-        }
-        
-    # ✅ FIXED: Añadir el retorno cuando device SÍ existe
-    return {
-        "identifiers": {(DOMAIN, device_id)},
-        "name": device.get("name", "Dispositivo Desconocido"),
-        "manufacturer": "Lockevod",
-        "model": f"{device.get('__typename', 'Desconocido')} ({device.get('provider', 'Desconocido')})",
-        "sw_version": device.get("deviceType", "Desconocido"),
-    }
+    for account_number, device in coordinator.chargepoint_devices:
+        device_id = device["id"]
+        # Add charger-specific sensors (order: contrato, dirección, estado, planificada, fecha, duración, energía, coste)
+        # NEW: Reference sensors for contract info in charger device (FIRST)
+        for description in CHARGER_REFERENCE_SENSORS:
+            yield OctopusChargerReferenceSensor(coordinator, account_number, device_id, description)
+        yield OctopusDeviceStateSensor(coordinator, account_number, device_id)
+        yield OctopusChargerPlannedDispatchesSensor(coordinator, device_id)
+        # NEW: Automation-friendly sensors for planned dispatches and the last session
+        for description in CHARGER_SESSION_SENSORS:
+            yield OctopusChargerSessionSensor(coordinator, device_id, description)
+        # REMOVED: OctopusChargerPreferencesSensor - no aporta valor según usuario
 
 
-class OctopusCurrentPriceEVSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for current electricity price with EV charging discount."""
+class _AccountScopedEntity(CoordinatorEntity, SensorEntity):
+    """Base for sensors attached to the shared account device."""
+
+    __slots__ = ()
 
     def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, account_number: str) -> None:
         super().__init__(coordinator)
         self._account_number = account_number
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return the account device info shared by every account sensor."""
+        return self.coordinator.account_device_info
+
+
+class _DeviceScopedEntity(CoordinatorEntity, SensorEntity):
+    """Base for sensors attached to a single Octopus device."""
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        coordinator: OctopusSpainDataUpdateCoordinator,
+        device_id: str,
+        account_number: str | None = None,
+    ) -> None:
+        super().__init__(coordinator)
+        self._device_id = device_id
+        self._account_number = account_number or self._find_account_for_device(device_id)
+        self._device_info_cache: tuple[dict[str, Any] | None, dict[str, Any]] | None = None
+
+    def _find_account_for_device(self, device_id: str) -> str | None:
+        """Find which account this device belongs to."""
+        return self.coordinator.account_by_device_id.get(device_id)
+
+    def _get_device_data(self) -> dict[str, Any] | None:
+        """Get device data from coordinator."""
+        return self.coordinator.devices_by_id.get(self._device_id)
+
+    def _get_parsed_dispatches(self) -> dict[str, Any]:
+        """Get this device's planned dispatches as parsed by the coordinator."""
+        return self.coordinator.data.get("planned_dispatches_formatted", {}).get(self._device_id, {})
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device information, rebuilt only when the device record changes."""
+        device = self._get_device_data()
+        cache = self._device_info_cache
+        if cache is None or cache[0] is not device:
+            cache = self._device_info_cache = (device, safe_device_info(self._device_id, device))
+        return cache[1]
+
+
+class OctopusCurrentPriceEVSensor(_AccountScopedEntity):
+    """Sensor for current electricity price with EV charging discount."""
+
+    __slots__ = ()
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "current_price_ev"
+    _attr_native_unit_of_measurement = "€/kWh"
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_icon = "mdi:car-electric"
+
+    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, account_number: str, name_suffix: str) -> None:
+        super().__init__(coordinator, account_number)
         
-        is_single_account = len(coordinator.accounts) == 1
-        self._attr_name = "Octopus Precio Actual EV" if is_single_account else f"Octopus Precio Actual EV ({account_number})"
-        self._attr_unique_id = f"octopus_{account_number}_12_current_price_ev"  # Added 12_ prefix
-        self._attr_native_unit_of_measurement = "€/kWh"
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_icon = "mdi:car-electric"
+        if name_suffix:
+            # Several accounts share one device, keep explicit names to tell them apart
+            self._attr_has_entity_name = False
+            self._attr_name = f"Octopus Precio Actual EV{name_suffix}"
+        self._attr_unique_id = sys.intern(f"octopus_{account_number}_12_current_price_ev")  # Added 12_ prefix
+        self._update_cached_state()
+
+    def _update_cached_state(self) -> None:
+        """Build the EV price attributes once per coordinator refresh."""
+        self._cached_attrs = self._build_attrs()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
 
     def _get_charger_device_id(self) -> str | None:
         """Find the first charger device for this account."""
-        devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-        for device in devices:
-            if device.get("__typename") == "SmartFlexChargePoint":
-                return device.get("id")
-        return None
+        return self.coordinator.charger_id_by_account.get(self._account_number)
 
     def _is_charger_connected(self, device_id: str) -> bool:
         """Check if charger is connected."""
-        devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-        for device in devices:
-            if device.get("id") == device_id:
-                current_state = device.get("status", {}).get("currentState")
-                connected_states = ["SMART_CONTROL_CAPABLE", "BOOSTING", "SMART_CONTROL_IN_PROGRESS"]
-                return current_state in connected_states
-        return False
+        device = self.coordinator.devices_by_id.get(device_id)
+        if device is None:
+            return False
+        return device_current_state(device) in CONNECTED_STATES
 
     def _get_current_price_with_ev_discount(self) -> float | None:
         """Get current price with EV discount applied if charging is scheduled."""
@@ -183,21 +237,11 @@ class OctopusCurrentPriceEVSensor(CoordinatorEntity, SensorEntity):
         now = datetime.now(tz)
         
         # Check if we're currently in a scheduled charging period
-        dispatches = self.coordinator.data.get("planned_dispatches", {}).get(device_id, [])
-        for dispatch in dispatches:
-            start_time = dispatch.get("start")
-            end_time = dispatch.get("end")
-            
-            if start_time and end_time:
-                try:
-                    start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-                    
-                    if start_dt <= now < end_dt:
-                        # We're in a charging period, return EV price
-                        return 0.068
-                except (ValueError, TypeError):
-                    continue
+        parsed = self.coordinator.data.get("planned_dispatches_formatted", {}).get(device_id, {})
+        for start_dt, end_dt in zip(parsed.get("starts", []), parsed.get("ends", [])):
+            if start_dt <= now < end_dt:
+                # We're in a charging period, return EV price
+                return 0.068
         
         # Not in charging period, return normal price
         return self._get_normal_current_price()
@@ -222,21 +266,14 @@ class OctopusCurrentPriceEVSensor(CoordinatorEntity, SensorEntity):
                 end_dt = datetime.fromisoformat(price_entry["end"])
                 
                 if start_dt <= now < end_dt:
-                    return float(price_entry["value"])
+                    return price_entry["value"]
             except (ValueError, TypeError, KeyError):
                 continue
         
-        # Fallback: calculate directly from tariff
-        tariff_data = self.coordinator.data.get("agreement_prices", {}).get(self._account_number, {})
-        prices = tariff_data.get("product", {}).get("prices", {})
-        variable_terms = prices.get("variableTerm", [])
-        
-        if len(variable_terms) >= 3:
-            price_peak = float(variable_terms[0])
-            price_standard = float(variable_terms[1]) 
-            price_valley = float(variable_terms[2])
-            
-            return self._calculate_spanish_price(now, price_peak, price_standard, price_valley)
+        # Fallback: calculate directly from the tariff rates the coordinator parsed
+        rates = hourly_data.get("rates")
+        if rates:
+            return self._calculate_spanish_price(now, *rates)
         
         return None
 
@@ -282,8 +319,9 @@ class OctopusCurrentPriceEVSensor(CoordinatorEntity, SensorEntity):
             return base_prices
         
         # Get planned dispatches
-        dispatches = self.coordinator.data.get("planned_dispatches", {}).get(device_id, [])
-        if not dispatches:
+        parsed = self.coordinator.data.get("planned_dispatches_formatted", {}).get(device_id, {})
+        dispatch_windows = list(zip(parsed.get("starts", []), parsed.get("ends", [])))
+        if not dispatch_windows:
             return base_prices
         
         # Create modified prices list
@@ -295,21 +333,11 @@ class OctopusCurrentPriceEVSensor(CoordinatorEntity, SensorEntity):
                 
                 # Check if this interval overlaps with any charging dispatch
                 is_charging_period = False
-                for dispatch in dispatches:
-                    dispatch_start = dispatch.get("start")
-                    dispatch_end = dispatch.get("end")
-                    
-                    if dispatch_start and dispatch_end:
-                        try:
-                            dispatch_start_dt = datetime.fromisoformat(dispatch_start.replace('Z', '+00:00'))
-                            dispatch_end_dt = datetime.fromisoformat(dispatch_end.replace('Z', '+00:00'))
-                            
-                            # Check if intervals overlap
-                            if (start_dt < dispatch_end_dt and end_dt > dispatch_start_dt):
-                                is_charging_period = True
-                                break
-                        except (ValueError, TypeError):
-                            continue
+                for dispatch_start_dt, dispatch_end_dt in dispatch_windows:
+                    # Check if intervals overlap
+                    if (start_dt < dispatch_end_dt and end_dt > dispatch_start_dt):
+                        is_charging_period = True
+                        break
                 
                 # Use EV price if in charging period, otherwise use normal price
                 price_value = 0.068 if is_charging_period else price_entry["value"]
@@ -330,6 +358,10 @@ class OctopusCurrentPriceEVSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return hourly prices for today and tomorrow with EV discount applied."""
+        return self._cached_attrs
+
+    def _build_attrs(self) -> dict[str, Any]:
+        """Build the EV price lists, charger info and current period attributes."""
         hourly_data = self.coordinator.data.get("hourly_prices", {}).get(self._account_number, {})
         
         # Get base prices
@@ -357,21 +389,15 @@ class OctopusCurrentPriceEVSensor(CoordinatorEntity, SensorEntity):
             attrs["charger_device_id"] = device_id
             attrs["charger_connected"] = self._is_charger_connected(device_id)
             
-            # Add dispatch info
-            dispatches = self.coordinator.data.get("planned_dispatches", {}).get(device_id, [])
+            # Add dispatch info, from the same well-formed dispatches the prices use
+            parsed = self.coordinator.data.get("planned_dispatches_formatted", {}).get(device_id, {})
+            dispatches = parsed.get("dispatches", [])
             attrs["charging_sessions_count"] = len(dispatches)
             
             if dispatches:
-                charging_periods = []
-                for dispatch in dispatches:
-                    start_time = dispatch.get("start")
-                    end_time = dispatch.get("end")
-                    if start_time and end_time:
-                        charging_periods.append({
-                            "start": start_time,
-                            "end": end_time
-                        })
-                attrs["charging_periods"] = charging_periods
+                attrs["charging_periods"] = [
+                    {"start": dispatch["start"], "end": dispatch["end"]} for dispatch in dispatches
+                ]
         else:
             attrs["charger_device_id"] = None
             attrs["charger_connected"] = False
@@ -379,7 +405,7 @@ class OctopusCurrentPriceEVSensor(CoordinatorEntity, SensorEntity):
         
         # Add convenience attributes
         if ev_today:
-            prices_values = [float(p["value"]) for p in ev_today if "value" in p]
+            prices_values = [p["value"] for p in ev_today if "value" in p]
             if prices_values:
                 attrs["today_min_price"] = min(prices_values)
                 attrs["today_max_price"] = max(prices_values)
@@ -391,7 +417,7 @@ class OctopusCurrentPriceEVSensor(CoordinatorEntity, SensorEntity):
                 attrs["today_ev_discount_periods"] = len(ev_periods)
         
         if ev_tomorrow:
-            prices_values = [float(p["value"]) for p in ev_tomorrow if "value" in p]
+            prices_values = [p["value"] for p in ev_tomorrow if "value" in p]
             if prices_values:
                 attrs["tomorrow_min_price"] = min(prices_values)
                 attrs["tomorrow_max_price"] = max(prices_values)
@@ -402,9 +428,7 @@ class OctopusCurrentPriceEVSensor(CoordinatorEntity, SensorEntity):
                 ev_periods = [p for p in ev_tomorrow if p.get("value") == 0.068]
                 attrs["tomorrow_ev_discount_periods"] = len(ev_periods)
         
-        # Add current period info
-        import pytz
-        tz = pytz.timezone('Europe/Madrid')
+        # Add current period info, as of this refresh
         now = datetime.now(tz)
         
         for price_entry in ev_today:
@@ -423,291 +447,207 @@ class OctopusCurrentPriceEVSensor(CoordinatorEntity, SensorEntity):
         
         return attrs
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry_id)},
-            "name": "Octopus Energy EV España",
-            "manufacturer": "Lockevod",
-            "model": "Spain",
-        }
-
 
 # NEW SENSORS - Contract and Property Information
 
-class OctopusContractNumberSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for contract number."""
-
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, account_number: str) -> None:
-        super().__init__(coordinator)
-        self._account_number = account_number
-        
-        is_single_account = len(coordinator.accounts) == 1
-        self._attr_name = "Octopus Número de Contrato" if is_single_account else f"Octopus Número de Contrato ({account_number})"
-        self._attr_unique_id = f"octopus_{account_number}_01_contract_number"  # FIXED: Added 01_ prefix
-        self._attr_icon = "mdi:file-document-outline"
-
-    @property
-    def native_value(self) -> str | None:
-        properties_data = self.coordinator.data.get("account_properties", {}).get(self._account_number, {})
-        return properties_data.get("number")
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry_id)},
-            "name": "Octopus Energy EV España",
-            "manufacturer": "Lockevod",
-            "model": "Spain",
-        }
-
-
-class OctopusAddressSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for property address."""
-
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, account_number: str) -> None:
-        super().__init__(coordinator)
-        self._account_number = account_number
-        
-        is_single_account = len(coordinator.accounts) == 1
-        self._attr_name = "Octopus Dirección" if is_single_account else f"Octopus Dirección ({account_number})"
-        self._attr_unique_id = f"octopus_{account_number}_02_address"  # FIXED: Added 02_ prefix
-        self._attr_icon = "mdi:home"
-
-    @property
-    def native_value(self) -> str | None:
-        properties_data = self.coordinator.data.get("account_properties", {}).get(self._account_number, {})
-        if properties_data.get("properties"):
-            return properties_data["properties"][0].get("address")
-        return None
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry_id)},
-            "name": "Octopus Energy EV España",
-            "manufacturer": "Lockevod",
-            "model": "Spain",
-        }
-
-
-class OctopusCupsSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for electricity CUPS."""
-
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, account_number: str) -> None:
-        super().__init__(coordinator)
-        self._account_number = account_number
-        
-        is_single_account = len(coordinator.accounts) == 1
-        self._attr_name = "Octopus CUPS Electricidad" if is_single_account else f"Octopus CUPS Electricidad ({account_number})"
-        self._attr_unique_id = f"octopus_{account_number}_03_electricity_cups"  # FIXED: Added 03_ prefix
-        self._attr_icon = "mdi:electric-switch"
-
-    @property
-    def native_value(self) -> str | None:
-        meters_data = self.coordinator.data.get("property_meters", {}).get(self._account_number, {})
-        electricity_points = meters_data.get("electricitySupplyPoints", [])
-        if electricity_points:
-            return electricity_points[0].get("cups")
-        return None
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry_id)},
-            "name": "Octopus Energy EV España",
-            "manufacturer": "Lockevod",
-            "model": "Spain",
-        }
-
-
-class OctopusContractTypeSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for contract type."""
-
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, account_number: str) -> None:
-        super().__init__(coordinator)
-        self._account_number = account_number
-        
-        is_single_account = len(coordinator.accounts) == 1
-        self._attr_name = "Octopus Tipo de Contrato" if is_single_account else f"Octopus Tipo de Contrato ({account_number})"
-        self._attr_unique_id = f"octopus_{account_number}_04_contract_type"  # FIXED: Added 04_ prefix
-        self._attr_icon = "mdi:file-contract"
-
-    @property
-    def native_value(self) -> str | None:
-        agreement_data = self.coordinator.data.get("electricity_agreements", {}).get(self._account_number, {})
-        active_agreement = agreement_data.get("activeAgreement")
-        if active_agreement:
-            return active_agreement.get("product", {}).get("displayName")
-        return None
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry_id)},
-            "name": "Octopus Energy EV España",
-            "manufacturer": "Lockevod",
-            "model": "Spain",
-        }
-
+def _active_agreement(data: dict[str, Any], account_number: str) -> dict[str, Any] | None:
+    """Return the active electricity agreement for an account."""
+    return data.get("electricity_agreements", {}).get(account_number, {}).get("activeAgreement")
+
+
+class AccountInfoSensorSpec(NamedTuple):
+    """Description of an account information sensor."""
+
+    key: str
+    name: str
+    prefix: str
+    icon: str
+    device_class: SensorDeviceClass | None
+    value_fn: Callable[[AccountSnapshot], Any]
+    exists_fn: Callable[[dict[str, Any], str], bool]
+
+
+ACCOUNT_INFO_SENSORS: tuple[AccountInfoSensorSpec, ...] = (
+    AccountInfoSensorSpec(
+        key="contract_number",
+        name="Octopus Número de Contrato",
+        prefix=SENSOR_PREFIX_CONTRACT_NUMBER,
+        icon="mdi:file-document-outline",
+        device_class=None,
+        value_fn=attrgetter("contract_number"),
+        exists_fn=lambda data, account: bool(data.get("account_properties", {}).get(account)),
+    ),
+    AccountInfoSensorSpec(
+        key="address",
+        name="Octopus Dirección",
+        prefix=SENSOR_PREFIX_ADDRESS,
+        icon="mdi:home",
+        device_class=None,
+        value_fn=attrgetter("address"),
+        exists_fn=lambda data, account: bool(data.get("account_properties", {}).get(account, {}).get("properties")),
+    ),
+    AccountInfoSensorSpec(
+        key="electricity_cups",
+        name="Octopus CUPS Electricidad",
+        prefix=SENSOR_PREFIX_CUPS,
+        icon="mdi:electric-switch",
+        device_class=None,
+        value_fn=attrgetter("cups"),
+        exists_fn=lambda data, account: bool(data.get("property_meters", {}).get(account, {}).get("electricitySupplyPoints")),
+    ),
+    AccountInfoSensorSpec(
+        key="contract_type",
+        name="Octopus Tipo de Contrato",
+        prefix=SENSOR_PREFIX_CONTRACT_TYPE,
+        icon="mdi:file-contract",
+        device_class=None,
+        value_fn=attrgetter("contract_type"),
+        exists_fn=lambda data, account: bool(_active_agreement(data, account)),
+    ),
+    AccountInfoSensorSpec(
+        key="contract_valid_from",
+        name="Octopus Contrato Válido Desde",
+        prefix=SENSOR_PREFIX_CONTRACT_VALID_FROM,
+        icon="mdi:calendar-start",
+        device_class=SensorDeviceClass.DATE,
+        value_fn=attrgetter("valid_from"),
+        exists_fn=lambda data, account: bool(_active_agreement(data, account)),
+    ),
+    AccountInfoSensorSpec(
+        key="contract_valid_to",
+        name="Octopus Contrato Válido Hasta",
+        prefix=SENSOR_PREFIX_CONTRACT_VALID_TO,
+        icon="mdi:calendar-end",
+        device_class=SensorDeviceClass.DATE,
+        value_fn=attrgetter("valid_to"),
+        exists_fn=lambda data, account: bool(_active_agreement(data, account)),
+    ),
+)
 
-class OctopusContractValidFromSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for contract valid from date."""
 
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, account_number: str) -> None:
-        super().__init__(coordinator)
-        self._account_number = account_number
-        
-        is_single_account = len(coordinator.accounts) == 1
-        self._attr_name = "Octopus Contrato Válido Desde" if is_single_account else f"Octopus Contrato Válido Desde ({account_number})"
-        self._attr_unique_id = f"octopus_{account_number}_05_contract_valid_from"  # FIXED: Added 05_ prefix
-        self._attr_device_class = SensorDeviceClass.DATE
-        self._attr_icon = "mdi:calendar-start"
+class OctopusAccountInfoSensor(_AccountScopedEntity):
+    """Sensor for contract and property information."""
 
-    @property
-    def native_value(self) -> str | None:
-        agreement_data = self.coordinator.data.get("electricity_agreements", {}).get(self._account_number, {})
-        active_agreement = agreement_data.get("activeAgreement")
-        if active_agreement:
-            valid_from = active_agreement.get("validFrom")
-            if valid_from:
-                try:
-                    return datetime.fromisoformat(valid_from.replace('Z', '+00:00')).date()
-                except ValueError:
-                    pass
-        return None
+    __slots__ = ()
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry_id)},
-            "name": "Octopus Energy EV España",
-            "manufacturer": "Lockevod",
-            "model": "Spain",
-        }
+    _attr_has_entity_name = True
 
+    def __init__(
+        self,
+        coordinator: OctopusSpainDataUpdateCoordinator,
+        account_number: str,
+        spec: AccountInfoSensorSpec,
+        name_suffix: str,
+    ) -> None:
+        super().__init__(coordinator, account_number)
+        self._spec = spec
 
-class OctopusContractValidToSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for contract valid to date."""
+        self._attr_translation_key = spec.key
+        if name_suffix:
+            # Several accounts share one device, keep explicit names to tell them apart
+            self._attr_has_entity_name = False
+            self._attr_name = f"{spec.name}{name_suffix}"
+        self._attr_unique_id = sys.intern(f"octopus_{account_number}_{spec.prefix}_{spec.key}")
+        self._attr_device_class = spec.device_class
+        self._attr_icon = spec.icon
+        self._update_cached_state()
 
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, account_number: str) -> None:
-        super().__init__(coordinator)
-        self._account_number = account_number
-        
-        is_single_account = len(coordinator.accounts) == 1
-        self._attr_name = "Octopus Contrato Válido Hasta" if is_single_account else f"Octopus Contrato Válido Hasta ({account_number})"
-        self._attr_unique_id = f"octopus_{account_number}_06_contract_valid_to"  # FIXED: Added 06_ prefix
-        self._attr_device_class = SensorDeviceClass.DATE
-        self._attr_icon = "mdi:calendar-end"
+    def _update_cached_state(self) -> None:
+        """Read the value from the account snapshot once per coordinator refresh."""
+        snapshot = self.coordinator.data.get("snapshots", {}).get(self._account_number)
+        self._cached_value = self._spec.value_fn(snapshot) if snapshot else None
 
-    @property
-    def native_value(self) -> str | None:
-        agreement_data = self.coordinator.data.get("electricity_agreements", {}).get(self._account_number, {})
-        active_agreement = agreement_data.get("activeAgreement")
-        if active_agreement:
-            valid_to = active_agreement.get("validTo")
-            if valid_to:
-                try:
-                    return datetime.fromisoformat(valid_to.replace('Z', '+00:00')).date()
-                except ValueError:
-                    pass
-        return None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
 
     @property
-    def device_info(self) -> dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry_id)},
-            "name": "Octopus Energy EV España",
-            "manufacturer": "Lockevod",
-            "model": "Spain",
-        }
+    def native_value(self) -> str | date | None:
+        return self._cached_value
 
 
 # CHARGER REFERENCE SENSORS - Show contract info also in charger device
 
-class OctopusChargerContractReferenceSensor(CoordinatorEntity, SensorEntity):
-    """Reference sensor for contract number in charger device."""
-
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, account_number: str, device_id: str) -> None:
-        super().__init__(coordinator)
-        self._account_number = account_number
-        self._device_id = device_id
-        
-        device = self._get_device_data()
-        device_name = device.get("name", "Charger") if device else "Charger"
-        self._attr_name = f"{device_name} Contract Number"
-        self._attr_unique_id = f"octopus_{device_id}_01_contract_number_ref"
-        self._attr_translation_key = "contract_number"  # Use translation key
-        self._attr_icon = "mdi:file-document-outline"
-
-    def _get_device_data(self) -> dict[str, Any] | None:
-        """Get device data from coordinator."""
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            pass
-        return None
+@dataclass(frozen=True, kw_only=True)
+class ChargerReferenceSensorEntityDescription(SensorEntityDescription):
+    """Description of an account value repeated on the charger device."""
+
+    prefix: str
+    value_fn: Callable[[AccountSnapshot], Any]
+
+
+CHARGER_REFERENCE_SENSORS: tuple[ChargerReferenceSensorEntityDescription, ...] = (
+    ChargerReferenceSensorEntityDescription(
+        key="contract_number",
+        name="Contract Number",
+        translation_key="contract_number",
+        prefix="01",
+        icon="mdi:file-document-outline",
+        value_fn=attrgetter("contract_number"),
+    ),
+    ChargerReferenceSensorEntityDescription(
+        key="address",
+        name="Address",
+        translation_key="address",
+        prefix="02",
+        icon="mdi:home",
+        value_fn=attrgetter("address"),
+    ),
+)
 
-    @property
-    def native_value(self) -> str | None:
-        properties_data = self.coordinator.data.get("account_properties", {}).get(self._account_number, {})
-        return properties_data.get("number")
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information for charger."""
-        device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
+class OctopusChargerReferenceSensor(_DeviceScopedEntity):
+    """Reference sensor for account information in charger device."""
 
+    __slots__ = ()
 
-class OctopusChargerAddressReferenceSensor(CoordinatorEntity, SensorEntity):
-    """Reference sensor for address in charger device."""
+    entity_description: ChargerReferenceSensorEntityDescription
 
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, account_number: str, device_id: str) -> None:
-        super().__init__(coordinator)
-        self._account_number = account_number
-        self._device_id = device_id
+    def __init__(
+        self,
+        coordinator: OctopusSpainDataUpdateCoordinator,
+        account_number: str,
+        device_id: str,
+        description: ChargerReferenceSensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, device_id, account_number)
+        self.entity_description = description
         
-        device = self._get_device_data()
-        device_name = device.get("name", "Charger") if device else "Charger"
-        self._attr_name = f"{device_name} Address"
-        self._attr_unique_id = f"octopus_{device_id}_02_address_ref"
-        self._attr_translation_key = "address"  # Use translation key
-        self._attr_icon = "mdi:home"
+        device_name = coordinator.device_name_by_id.get(device_id, "Charger")
+        self._attr_name = f"{device_name} {description.name}"
+        self._attr_unique_id = sys.intern(f"octopus_{device_id}_{description.prefix}_{description.key}_ref")
+        self._update_cached_state()
 
-    def _get_device_data(self) -> dict[str, Any] | None:
-        """Get device data from coordinator."""
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            pass
-        return None
+    def _update_cached_state(self) -> None:
+        """Read the value from the account snapshot once per coordinator refresh."""
+        snapshot = self.coordinator.data.get("snapshots", {}).get(self._account_number)
+        self._cached_value = self.entity_description.value_fn(snapshot) if snapshot else None
 
-    @property
-    def native_value(self) -> str | None:
-        properties_data = self.coordinator.data.get("account_properties", {}).get(self._account_number, {})
-        if properties_data.get("properties"):
-            return properties_data["properties"][0].get("address")
-        return None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
 
     @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information for charger."""
-        device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
+    def native_value(self) -> str | None:
+        return self._cached_value
 
 
 # EXISTING SENSORS - With some modifications
 
-class OctopusLedgerSensor(CoordinatorEntity, SensorEntity):
+class OctopusLedgerSensor(_AccountScopedEntity):
     """Sensor for account ledger balances."""
 
+    __slots__ = ()
+
+    _attr_native_unit_of_measurement = CURRENCY_EURO
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_state_class = SensorStateClass.TOTAL
+    _attr_icon = "mdi:wallet"
+
     def __init__(
         self,
         coordinator: OctopusSpainDataUpdateCoordinator,
@@ -715,8 +655,7 @@ class OctopusLedgerSensor(CoordinatorEntity, SensorEntity):
         ledger: dict[str, Any],
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._account_number = account_number
+        super().__init__(coordinator, account_number)
         self._ledger = ledger
         self._ledger_type = ledger["ledgerType"]
         
@@ -726,94 +665,86 @@ class OctopusLedgerSensor(CoordinatorEntity, SensorEntity):
         
         # FIXED: Added numeric prefixes for proper ordering
         if self._ledger_type == ELECTRICITY_LEDGER:
-            self._attr_unique_id = f"octopus_{account_number}_07_electricity_balance"
+            self._attr_unique_id = sys.intern(f"octopus_{account_number}_07_electricity_balance")
         elif self._ledger_type == SOLAR_WALLET_LEDGER:
-            self._attr_unique_id = f"octopus_{account_number}_08_solar_wallet_balance"
+            self._attr_unique_id = sys.intern(f"octopus_{account_number}_08_solar_wallet_balance")
         else:
             # Fallback for any other ledger types
-            self._attr_unique_id = f"octopus_{account_number}_99_{self._ledger_type.lower()}_balance"
+            self._attr_unique_id = sys.intern(f"octopus_{account_number}_99_{self._ledger_type.lower()}_balance")
             
-        self._attr_native_unit_of_measurement = CURRENCY_EURO
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_state_class = SensorStateClass.TOTAL
-        self._attr_icon = "mdi:wallet"
+        self._update_cached_state()
+
+    def _get_ledger(self) -> dict[str, Any] | None:
+        """Get this sensor's ledger from the coordinator index."""
+        account_data = self.coordinator.data.get("accounts", {}).get(self._account_number, {})
+        return account_data.get("ledgers_by_type", {}).get(self._ledger_type)
 
     @property
     def native_value(self) -> float | None:
         """Return the balance value."""
-        account_data = self.coordinator.data.get("accounts", {}).get(self._account_number, {})
-        for ledger in account_data.get("ledgers", []):
-            if ledger["ledgerType"] == self._ledger_type:
-                # Balance is in cents, convert to euros
-                return float(ledger["balance"]) / 100
+        ledger = self._ledger
+        if ledger:
+            return ledger["balance_eur"]
         return None
 
+    def _update_cached_state(self) -> None:
+        """Rebind the ledger and build attributes once per coordinator refresh."""
+        ledger = self._ledger = self._get_ledger()
+        if ledger:
+            get = ledger.get
+            self._cached_attrs = {
+                "ledger_number": get("number"),
+                "accepts_payments": get("acceptsPayments"),
+                "account_number": self._account_number,
+                "ledger_type": self._ledger_type,
+            }
+        else:
+            self._cached_attrs = {}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        account_data = self.coordinator.data.get("accounts", {}).get(self._account_number, {})
-        for ledger in account_data.get("ledgers", []):
-            if ledger["ledgerType"] == self._ledger_type:
-                return {
-                    "ledger_number": ledger.get("number"),
-                    "accepts_payments": ledger.get("acceptsPayments"),
-                    "account_number": self._account_number,
-                    "ledger_type": self._ledger_type,
-                }
-        return {}
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry_id)},
-            "name": "Octopus Energy EV España",
-            "manufacturer": "Lockevod",
-            "model": "Spain",
-        }
+        return self._cached_attrs
 
 
-class OctopusInvoiceSensor(CoordinatorEntity, SensorEntity):
+class OctopusInvoiceSensor(_AccountScopedEntity):
     """Sensor for last invoice - FROM ORIGINAL REPO."""
 
+    __slots__ = ()
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "last_invoice"
+    _attr_native_unit_of_measurement = CURRENCY_EURO
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_state_class = SensorStateClass.TOTAL
+    _attr_icon = "mdi:currency-eur"
+
     def __init__(
         self,
         coordinator: OctopusSpainDataUpdateCoordinator,
         account_number: str,
+        name_suffix: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._account_number = account_number
-        
-        # Handle single vs multiple accounts naming
-        is_single_account = len(coordinator.accounts) == 1
-        self._attr_name = "Última Factura Octopus" if is_single_account else f"Última Factura Octopus ({account_number})"
-        self._attr_unique_id = f"octopus_{account_number}_09_last_invoice"  # FIXED: Added 09_ prefix
-        self._attr_native_unit_of_measurement = CURRENCY_EURO
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_state_class = SensorStateClass.TOTAL
-        self._attr_icon = "mdi:currency-eur"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the invoice amount."""
-        billing_data = self.coordinator.data.get("billing_info", {}).get(self._account_number, {})
-        last_invoice = billing_data.get("last_invoice")
+        super().__init__(coordinator, account_number)
         
-        if last_invoice and last_invoice.get("amount") is not None:
-            return float(last_invoice["amount"])
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if sensor is available."""
-        billing_data = self.coordinator.data.get("billing_info", {}).get(self._account_number, {})
-        return billing_data.get("last_invoice") is not None
+        if name_suffix:
+            # Several accounts share one device, keep explicit names to tell them apart
+            self._attr_has_entity_name = False
+            self._attr_name = f"Última Factura Octopus{name_suffix}"
+        self._attr_unique_id = sys.intern(f"octopus_{account_number}_09_last_invoice")  # FIXED: Added 09_ prefix
+        self._update_cached_state()
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
+    def _update_cached_state(self) -> None:
+        """Resolve the last invoice and its attributes once per coordinator refresh."""
         billing_data = self.coordinator.data.get("billing_info", {}).get(self._account_number, {})
-        last_invoice = billing_data.get("last_invoice")
+        self._last_invoice = last_invoice = billing_data.get("last_invoice")
         
         attrs = {
             "account_number": self._account_number,
@@ -828,38 +759,87 @@ class OctopusInvoiceSensor(CoordinatorEntity, SensorEntity):
             if last_invoice.get("issued"):
                 attrs["Emitida"] = last_invoice["issued"]
         
-        return attrs
+        self._cached_attrs = attrs
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
 
     @property
-    def device_info(self) -> dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry_id)},
-            "name": "Octopus Energy EV España",
-            "manufacturer": "Lockevod",
-            "model": "Spain",
-        }
+    def native_value(self) -> float | None:
+        """Return the invoice amount."""
+        # The coordinator already coerced the amount to float
+        return self._last_invoice["amount"] if self._last_invoice else None
+
+    @property
+    def available(self) -> bool:
+        """Return if sensor is available."""
+        return self._last_invoice is not None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra attributes."""
+        return self._cached_attrs
 
 
 # NEW PRICING SENSORS
 
-class OctopusTariffPricesSensor(CoordinatorEntity, SensorEntity):
+class OctopusTariffPricesSensor(_AccountScopedEntity):
     """Sensor for tariff price structure."""
 
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, account_number: str) -> None:
-        super().__init__(coordinator)
-        self._account_number = account_number
+    __slots__ = ()
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "tariff_prices"
+    _attr_icon = "mdi:currency-eur"
+
+    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, account_number: str, name_suffix: str) -> None:
+        super().__init__(coordinator, account_number)
         
-        is_single_account = len(coordinator.accounts) == 1
-        self._attr_name = "Octopus Precios Tarifa" if is_single_account else f"Octopus Precios Tarifa ({account_number})"
-        self._attr_unique_id = f"octopus_{account_number}_10_tariff_prices"  # Added 10_ prefix
-        self._attr_icon = "mdi:currency-eur"
+        if name_suffix:
+            # Several accounts share one device, keep explicit names to tell them apart
+            self._attr_has_entity_name = False
+            self._attr_name = f"Octopus Precios Tarifa{name_suffix}"
+        self._attr_unique_id = sys.intern(f"octopus_{account_number}_10_tariff_prices")  # Added 10_ prefix
+        self._update_cached_state()
+
+    def _get_prices(self) -> dict[str, Any]:
+        """Get this account's agreement prices from the coordinator."""
+        prices_data = self.coordinator.data.get("agreement_prices", {}).get(self._account_number, {})
+        return prices_data.get("product", {}).get("prices", {})
+
+    def _update_cached_state(self) -> None:
+        """Rebuild the summary and attributes once per coordinator refresh."""
+        prices = self._get_prices()
+        self._cached_value = self._summarize(prices)
+        self._cached_attrs = self._build_attrs(prices)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state before notifying Home Assistant."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> str | None:
         """Return tariff price summary."""
-        prices_data = self.coordinator.data.get("agreement_prices", {}).get(self._account_number, {})
-        prices = prices_data.get("product", {}).get("prices", {})
-        
+        return self._cached_value
+
+    @property
+    def available(self) -> bool:
+        """Return if sensor is available."""
+        return bool(self._get_prices())
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra attributes with detailed pricing."""
+        return self._cached_attrs
+
+    @staticmethod
+    def _summarize(prices: dict[str, Any]) -> str:
+        """Summarize the variable terms of the tariff."""
         if not prices:
             return "No disponible"
         
@@ -878,18 +858,8 @@ class OctopusTariffPricesSensor(CoordinatorEntity, SensorEntity):
         
         return "Sin datos de precios"
 
-    @property
-    def available(self) -> bool:
-        """Return if sensor is available."""
-        prices_data = self.coordinator.data.get("agreement_prices", {}).get(self._account_number, {})
-        return bool(prices_data.get("product", {}).get("prices"))
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes with detailed pricing."""
-        prices_data = self.coordinator.data.get("agreement_prices", {}).get(self._account_number, {})
-        prices = prices_data.get("product", {}).get("prices", {})
-        
+    def _build_attrs(self, prices: dict[str, Any]) -> dict[str, Any]:
+        """Build the detailed pricing attributes."""
         attrs = {
             "account_number": self._account_number,
         }
@@ -931,29 +901,26 @@ class OctopusTariffPricesSensor(CoordinatorEntity, SensorEntity):
         
         return attrs
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry_id)},
-            "name": "Octopus Energy EV España",
-            "manufacturer": "Lockevod",
-            "model": "Spain",
-        }
-
 
-class OctopusCurrentPriceSensor(CoordinatorEntity, SensorEntity):
+class OctopusCurrentPriceSensor(_AccountScopedEntity):
     """Sensor for current electricity price."""
 
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, account_number: str) -> None:
-        super().__init__(coordinator)
-        self._account_number = account_number
+    __slots__ = ()
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "current_price"
+    _attr_native_unit_of_measurement = "€/kWh"
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_icon = "mdi:cash"
+
+    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, account_number: str, name_suffix: str) -> None:
+        super().__init__(coordinator, account_number)
         
-        is_single_account = len(coordinator.accounts) == 1
-        self._attr_name = "Octopus Precio Actual" if is_single_account else f"Octopus Precio Actual ({account_number})"
-        self._attr_unique_id = f"octopus_{account_number}_11_current_price"  # Added 11_ prefix
-        self._attr_native_unit_of_measurement = "€/kWh"
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_icon = "mdi:cash"
+        if name_suffix:
+            # Several accounts share one device, keep explicit names to tell them apart
+            self._attr_has_entity_name = False
+            self._attr_name = f"Octopus Precio Actual{name_suffix}"
+        self._attr_unique_id = sys.intern(f"octopus_{account_number}_11_current_price")  # Added 11_ prefix
 
     def _get_current_price(self) -> float | None:
         """Get current price based on time from generated hourly data."""
@@ -975,22 +942,15 @@ class OctopusCurrentPriceSensor(CoordinatorEntity, SensorEntity):
                 end_dt = datetime.fromisoformat(price_entry["end"])
                 
                 if start_dt <= now < end_dt:
-                    return float(price_entry["value"])
+                    return price_entry["value"]
             except (ValueError, TypeError, KeyError):
                 continue
         
-        # Fallback: calculate directly from tariff if no match found
-        tariff_data = self.coordinator.data.get("agreement_prices", {}).get(self._account_number, {})
-        prices = tariff_data.get("product", {}).get("prices", {})
-        variable_terms = prices.get("variableTerm", [])
-        
-        if len(variable_terms) >= 3:
+        # Fallback: calculate directly from the tariff rates if no match found
+        rates = hourly_data.get("rates")
+        if rates:
             # Use Spanish tariff logic
-            price_peak = float(variable_terms[0])
-            price_standard = float(variable_terms[1]) 
-            price_valley = float(variable_terms[2])
-            
-            return self._calculate_spanish_price(now, price_peak, price_standard, price_valley)
+            return self._calculate_spanish_price(now, *rates)
         
         return None
     
@@ -1044,7 +1004,7 @@ class OctopusCurrentPriceSensor(CoordinatorEntity, SensorEntity):
         tomorrow_prices = hourly_data.get("tomorrow", [])
         
         if today_prices:
-            prices_values = [float(p["value"]) for p in today_prices if "value" in p]
+            prices_values = [p["value"] for p in today_prices if "value" in p]
             if prices_values:
                 attrs["today_min_price"] = min(prices_values)
                 attrs["today_max_price"] = max(prices_values)
@@ -1052,7 +1012,7 @@ class OctopusCurrentPriceSensor(CoordinatorEntity, SensorEntity):
                 attrs["today_prices_count"] = len(prices_values)
         
         if tomorrow_prices:
-            prices_values = [float(p["value"]) for p in tomorrow_prices if "value" in p]
+            prices_values = [p["value"] for p in tomorrow_prices if "value" in p]
             if prices_values:
                 attrs["tomorrow_min_price"] = min(prices_values)
                 attrs["tomorrow_max_price"] = max(prices_values)
@@ -1080,19 +1040,15 @@ class OctopusCurrentPriceSensor(CoordinatorEntity, SensorEntity):
         
         return attrs
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry_id)},
-            "name": "Octopus Energy EV España",
-            "manufacturer": "Lockevod",
-            "model": "Spain",
-        }
 
-
-class OctopusDeviceStateSensor(CoordinatorEntity, SensorEntity):
+class OctopusDeviceStateSensor(_DeviceScopedEntity):
     """Sensor for device current state."""
 
+    __slots__ = ()
+
+    _attr_translation_key = "device_state"
+    _attr_icon = "mdi:state-machine"
+
     def __init__(
         self,
         coordinator: OctopusSpainDataUpdateCoordinator,
@@ -1100,57 +1056,20 @@ class OctopusDeviceStateSensor(CoordinatorEntity, SensorEntity):
         device_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._account_number = account_number
-        self._device_id = device_id
-        
-        device = self._get_device_data()
-        device_name = device.get("name", "Device") if device else "Device"
+        super().__init__(coordinator, device_id, account_number)
+        device_name = coordinator.device_name_by_id.get(device_id, "Device")
         self._attr_name = f"{device_name} State"
-        self._attr_unique_id = f"octopus_{device_id}_03_current_state"
-        self._attr_translation_key = "device_state"  # Use translation key
-        self._attr_icon = "mdi:state-machine"
-
-    def _get_device_data(self) -> dict[str, Any] | None:
-        """Get device data from coordinator."""
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            _LOGGER.warning("Failed to get device data for %s", self._device_id)
-        return None
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the current state."""
-        device = self._get_device_data()
-        if device:
-            current_state = device.get("status", {}).get("currentState")
-            
-            # Use English states - will be translated by HA
-            state_translations = {
-                "SMART_CONTROL_NOT_AVAILABLE": "disconnected",
-                "SMART_CONTROL_CAPABLE": "connected",
-                "BOOSTING": "boost_charging",
-                "SMART_CONTROL_IN_PROGRESS": "scheduled_charging"
-            }
-            
-            translated_state = state_translations.get(current_state, current_state)
-            return translated_state if translated_state else "unknown"
-        return "unknown"
+        self._attr_unique_id = sys.intern(f"octopus_{device_id}_03_current_state")
+        self._update_cached_state()
 
-    @property
-    def available(self) -> bool:
-        """Return if sensor is available."""
-        device = self._get_device_data()
-        return device is not None and device.get("status") is not None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
+    def _update_cached_state(self) -> None:
+        """Derive state, availability and attributes once per coordinator refresh."""
         device = self._get_device_data()
+        status = device.get("status") if device else None
+        raw_state = (status or {}).get("currentState")
+        
+        self._cached_value = STATE_TRANSLATIONS.get(raw_state, raw_state or "unknown") if device else "unknown"
+        self._cached_available = status is not None
         
         attrs = {
             "device_id": self._device_id,
@@ -1158,133 +1077,95 @@ class OctopusDeviceStateSensor(CoordinatorEntity, SensorEntity):
         }
         
         if device:
-            attrs.update({
-                "device_type": device.get("deviceType"),
-                "provider": device.get("provider"),
-                "property_id": device.get("propertyId"),
-            })
-            
-            raw_state = device.get("status", {}).get("currentState")
+            get = device.get
+            attrs["device_type"] = get("deviceType")
+            attrs["provider"] = get("provider")
+            attrs["property_id"] = get("propertyId")
             attrs["raw_state"] = raw_state
             
             # Add connection status
-            attrs["is_connected"] = raw_state in [
-                "SMART_CONTROL_CAPABLE", 
-                "BOOSTING", 
-                "SMART_CONTROL_IN_PROGRESS"
-            ]
+            attrs["is_connected"] = raw_state in CONNECTED_STATES
 
-        return attrs
+        self._cached_attrs = attrs
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
 
     @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
+    def native_value(self) -> str | None:
+        """Return the current state."""
+        return self._cached_value
+
+    @property
+    def available(self) -> bool:
+        """Return if sensor is available."""
+        return self._cached_available
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra attributes."""
+        return self._cached_attrs
 
 
-class OctopusChargerPlannedDispatchesSensor(CoordinatorEntity, SensorEntity):
+class OctopusChargerPlannedDispatchesSensor(_DeviceScopedEntity):
     """Sensor for planned charging dispatches - FIXED."""
 
+    __slots__ = ()
+
+    _attr_translation_key = "planned_dispatches"
+    _attr_icon = "mdi:calendar-clock"
+
     def __init__(
         self,
         coordinator: OctopusSpainDataUpdateCoordinator,
         device_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._device_id = device_id
-        # ✅ FIXED: Añadir búsqueda de account_number
-        self._account_number = self._find_account_for_device(device_id)
+        super().__init__(coordinator, device_id)
         
-        device = self._get_device_data()
-        device_name = device.get("name", "Charger") if device else "Charger"
+        device_name = coordinator.device_name_by_id.get(device_id, "Charger")
         self._attr_name = f"{device_name} Planned Sessions"
-        self._attr_unique_id = f"octopus_{device_id}_04_planned_dispatches"
-        self._attr_translation_key = "planned_dispatches"  # Use translation key
-        self._attr_icon = "mdi:calendar-clock"
+        self._attr_unique_id = sys.intern(f"octopus_{device_id}_04_planned_dispatches")
+        self._update_cached_state()
 
-    def _find_account_for_device(self, device_id: str) -> str | None:
-        """Find which account this device belongs to."""
-        for account_number, devices in self.coordinator.data.get("devices", {}).items():
-            for device in devices:
-                if device.get("id") == device_id:
-                    return account_number
-        return None
+    def _update_cached_state(self) -> None:
+        """Compute state and attributes once per coordinator refresh."""
+        self._cached_value = self._compute_native_value()
+        self._cached_attrs = self._compute_extra_state_attributes()
 
-    def _get_device_data(self) -> dict[str, Any] | None:
-        """Get device data from coordinator - FIXED."""
-        if not self._account_number:
-            return None
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            pass
-        return None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> str:
         """Return planned dispatches info with schedules - ENHANCED to show times."""
+        return self._cached_value
+
+    def _compute_native_value(self) -> str:
+        """Build planned dispatches summary from coordinator data."""
         device = self._get_device_data()
         if not device:
             return "Device not found"
         
-        current_state = device.get("status", {}).get("currentState")
-        dispatches = self.coordinator.data.get("planned_dispatches", {}).get(self._device_id, [])
+        current_state = device_current_state(device)
         
         # Check if car is connected
-        connected_states = ["SMART_CONTROL_CAPABLE", "BOOSTING", "SMART_CONTROL_IN_PROGRESS"]
-        is_connected = current_state in connected_states
+        is_connected = current_state in CONNECTED_STATES
         
         if not is_connected:
             return "Car not connected"
         
-        # Car is connected, show dispatch count and times
-        dispatch_count = len(dispatches)
-        if dispatch_count == 0:
+        # Car is connected, use the summary pre-formatted by the coordinator
+        formatted = self.coordinator.data.get("planned_dispatches_formatted", {}).get(self._device_id)
+        if not formatted:
             return "No scheduled sessions"
-        
-        # Format dispatches with times
-        try:
-            time_ranges = []
-            for dispatch in dispatches:
-                start_time = dispatch.get("start")
-                end_time = dispatch.get("end")
-                
-                if start_time and end_time:
-                    try:
-                        start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                        end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-                        
-                        # Format as HH:MM-HH:MM
-                        time_range = f"{start_dt.strftime('%H:%M')}-{end_dt.strftime('%H:%M')}"
-                        time_ranges.append(time_range)
-                    except ValueError:
-                        continue
-            
-            if time_ranges:
-                if dispatch_count == 1:
-                    return f"1 session: {time_ranges[0]}"
-                else:
-                    times_str = ", ".join(time_ranges)
-                    return f"{dispatch_count} sessions: {times_str}"
-            else:
-                # Fallback if time parsing fails
-                if dispatch_count == 1:
-                    return "1 scheduled session"
-                else:
-                    return f"{dispatch_count} scheduled sessions"
-                    
-        except Exception as err:
-            _LOGGER.warning("Failed to format dispatch times: %s", err)
-            # Fallback to simple count
-            if dispatch_count == 1:
-                return "1 scheduled session"
-            else:
-                return f"{dispatch_count} scheduled sessions"
+        return formatted["summary"]
 
     @property
     def available(self) -> bool:
@@ -1294,17 +1175,21 @@ class OctopusChargerPlannedDispatchesSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
+        return self._cached_attrs
+
+    def _compute_extra_state_attributes(self) -> dict[str, Any]:
+        """Build planned dispatches attributes from coordinator data."""
         device = self._get_device_data()
-        dispatches = self.coordinator.data.get("planned_dispatches", {}).get(self._device_id, [])
+        formatted = self.coordinator.data.get("planned_dispatches_formatted", {}).get(self._device_id, {})
+        dispatches = formatted.get("rich", [])
         
         attrs = {
             "device_id": self._device_id,
         }
         
         if device:
-            current_state = device.get("status", {}).get("currentState")
-            connected_states = ["SMART_CONTROL_CAPABLE", "BOOSTING", "SMART_CONTROL_IN_PROGRESS"]
-            is_connected = current_state in connected_states
+            current_state = device_current_state(device)
+            is_connected = current_state in CONNECTED_STATES
             
             attrs["is_connected"] = is_connected
             attrs["current_state"] = current_state
@@ -1312,541 +1197,216 @@ class OctopusChargerPlannedDispatchesSensor(CoordinatorEntity, SensorEntity):
             
             if is_connected and dispatches:
                 # Add formatted dispatch info
-                formatted_dispatches = []
-                for dispatch in dispatches:
-                    start_time = dispatch.get("start")
-                    end_time = dispatch.get("end")
-                    dispatch_type = dispatch.get("type")
-                    
-                    if start_time and end_time:
-                        try:
-                            start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                            end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-                            
-                            formatted_dispatches.append({
-                                "start": start_dt.strftime("%Y-%m-%d %H:%M"),
-                                "end": end_dt.strftime("%Y-%m-%d %H:%M"),
-                                "duration_hours": round((end_dt - start_dt).total_seconds() / 3600, 1),
-                                "type": dispatch_type
-                            })
-                        except ValueError:
-                            formatted_dispatches.append({
-                                "start": start_time,
-                                "end": end_time,
-                                "type": dispatch_type
-                            })
-                
-                attrs["dispatches"] = formatted_dispatches
+                attrs["dispatches"] = dispatches
                 
-                # Add next dispatch info
-                if formatted_dispatches:
-                    next_dispatch = formatted_dispatches[0]
-                    attrs["next_dispatch_start"] = next_dispatch["start"]
-                    attrs["next_dispatch_end"] = next_dispatch["end"]
-                    if "duration_hours" in next_dispatch:
-                        attrs["next_dispatch_duration_hours"] = next_dispatch["duration_hours"]
+                # Add next dispatch info; the coordinator sorts them by start
+                next_dispatch = dispatches[0]
+                attrs["next_dispatch_start"] = next_dispatch["start"]
+                attrs["next_dispatch_end"] = next_dispatch["end"]
+                attrs["next_dispatch_duration_hours"] = next_dispatch["duration_hours"]
 
         return attrs
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
-
-
-class OctopusChargerNextSessionStartSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for next session start time - FOR AUTOMATIONS."""
-
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, device_id: str) -> None:
-        super().__init__(coordinator)
-        self._device_id = device_id
-        # ✅ FIXED: Añadir búsqueda de account_number
-        self._account_number = self._find_account_for_device(device_id)
-        
-        device = self._get_device_data()
-        device_name = device.get("name", "Charger") if device else "Charger"
-        self._attr_name = f"{device_name} Next Session Start"
-        self._attr_unique_id = f"octopus_{device_id}_05_next_session_start"
-        self._attr_device_class = SensorDeviceClass.TIMESTAMP
-        self._attr_icon = "mdi:play-circle"
-
-    def _find_account_for_device(self, device_id: str) -> str | None:
-        """Find which account this device belongs to."""
-        for account_number, devices in self.coordinator.data.get("devices", {}).items():
-            for device in devices:
-                if device.get("id") == device_id:
-                    return account_number
-        return None
-
-    def _get_device_data(self) -> dict[str, Any] | None:
-        """Get device data from coordinator - FIXED."""
-        if not self._account_number:
-            return None
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            pass
-        return None
-
-    @property
-    def native_value(self) -> datetime | None:
-        """Return next session start datetime."""
-        dispatches = self.coordinator.data.get("planned_dispatches", {}).get(self._device_id, [])
-        
-        if not dispatches:
-            return None
-            
-        # Get the first (next) session
-        first_dispatch = dispatches[0]
-        start_time = first_dispatch.get("start")
-        
-        if start_time:
-            try:
-                return datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-            except ValueError:
-                pass
-        return None
-
-    @property
-    def available(self) -> bool:
-        return True
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        dispatches = self.coordinator.data.get("planned_dispatches", {}).get(self._device_id, [])
-        return {
-            "device_id": self._device_id,
-            "total_sessions": len(dispatches),
-            "has_sessions": len(dispatches) > 0
-        }
-
-
-class OctopusChargerNextSessionEndSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for last session end time today - FOR AUTOMATIONS."""
-
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, device_id: str) -> None:
-        super().__init__(coordinator)
-        self._device_id = device_id
-        # ✅ FIXED: Añadir búsqueda de account_number
-        self._account_number = self._find_account_for_device(device_id)
-        
-        device = self._get_device_data()
-        device_name = device.get("name", "Charger") if device else "Charger"
-        self._attr_name = f"{device_name} Last Session End"
-        self._attr_unique_id = f"octopus_{device_id}_06_last_session_end"
-        self._attr_device_class = SensorDeviceClass.TIMESTAMP
-        self._attr_icon = "mdi:stop-circle"
-
-    def _find_account_for_device(self, device_id: str) -> str | None:
-        """Find which account this device belongs to."""
-        for account_number, devices in self.coordinator.data.get("devices", {}).items():
-            for device in devices:
-                if device.get("id") == device_id:
-                    return account_number
-        return None
-
-    def _get_device_data(self) -> dict[str, Any] | None:
-        """Get device data from coordinator - FIXED."""
-        if not self._account_number:
-            return None
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            pass
-        return None
-
-    @property
-    def native_value(self) -> datetime | None:
-        """Return last session end datetime today."""
-        dispatches = self.coordinator.data.get("planned_dispatches", {}).get(self._device_id, [])
-        
-        if not dispatches:
-            return None
-            
-        # Get the last session's end time
-        last_dispatch = dispatches[-1]
-        end_time = last_dispatch.get("end")
-        
-        if end_time:
-            try:
-                return datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-            except ValueError:
-                pass
-        return None
-
-    @property
-    def available(self) -> bool:
-        return True
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
-
 
-class OctopusChargerTotalHoursTodaySensor(CoordinatorEntity, SensorEntity):
-    """Sensor for total charging hours today - FOR AUTOMATIONS."""
+def _dispatch_field(field: str) -> Callable[[OctopusChargerSessionSensor], Any]:
+    """Build a value function reading one field of the parsed dispatches."""
+    def value_fn(sensor: OctopusChargerSessionSensor) -> Any:
+        return sensor._get_parsed_dispatches().get(field)
+    return value_fn
 
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, device_id: str) -> None:
-        super().__init__(coordinator)
-        self._device_id = device_id
-        # ✅ FIXED: Añadir búsqueda de account_number
-        self._account_number = self._find_account_for_device(device_id)
-        
-        device = self._get_device_data()
-        device_name = device.get("name", "Charger") if device else "Charger"
-        self._attr_name = f"{device_name} Total Hours Today"
-        self._attr_unique_id = f"octopus_{device_id}_07_total_hours_today"
-        self._attr_native_unit_of_measurement = UnitOfTime.HOURS
-        self._attr_device_class = SensorDeviceClass.DURATION
-        self._attr_state_class = SensorStateClass.TOTAL
-        self._attr_icon = "mdi:clock-time-eight"
-
-    def _find_account_for_device(self, device_id: str) -> str | None:
-        """Find which account this device belongs to."""
-        for account_number, devices in self.coordinator.data.get("devices", {}).items():
-            for device in devices:
-                if device.get("id") == device_id:
-                    return account_number
-        return None
 
-    def _get_device_data(self) -> dict[str, Any] | None:
-        """Get device data from coordinator - FIXED."""
-        if not self._account_number:
-            return None
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            pass
-        return None
-
-    @property
-    def native_value(self) -> float:
-        """Return total hours of charging planned for today."""
-        dispatches = self.coordinator.data.get("planned_dispatches", {}).get(self._device_id, [])
-        
-        if not dispatches:
-            return 0.0
-            
-        total_hours = 0.0
-        
-        for dispatch in dispatches:
-            start_time = dispatch.get("start")
-            end_time = dispatch.get("end")
-            
-            if start_time and end_time:
-                try:
-                    start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-                    duration = (end_dt - start_dt).total_seconds() / 3600
-                    total_hours += duration
-                except ValueError:
-                    continue
-                    
-        return round(total_hours, 2)
-
-    @property
-    def available(self) -> bool:
-        return True
+def _session_count_attrs(sensor: OctopusChargerSessionSensor) -> dict[str, Any]:
+    session_count = len(sensor._get_parsed_dispatches().get("dispatches", []))
+    return {
+        "device_id": sensor._device_id,
+        "total_sessions": session_count,
+        "has_sessions": session_count > 0
+    }
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return detailed session info for automations."""
-        dispatches = self.coordinator.data.get("planned_dispatches", {}).get(self._device_id, [])
-        
-        attrs = {
-            "device_id": self._device_id,
-            "total_sessions": len(dispatches),
-            "session_details": []
+def _session_details_attrs(sensor: OctopusChargerSessionSensor) -> dict[str, Any]:
+    """Expand the session tuples the coordinator built while parsing dispatches."""
+    parsed = sensor._get_parsed_dispatches()
+    sessions = parsed.get("sessions", [])
+    session_details = [
+        {
+            "session_number": number,
+            "start_time": start,
+            "end_time": end,
+            "start_time_local": start_hm,
+            "end_time_local": end_hm,
+            "duration_hours": _round_hours(duration, 2),
+            "type": dispatch_type
         }
-        
-        # Add detailed session info
-        for i, dispatch in enumerate(dispatches):
-            start_time = dispatch.get("start")
-            end_time = dispatch.get("end")
-            dispatch_type = dispatch.get("type", "SMART")
-            
-            if start_time and end_time:
-                try:
-                    start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-                    duration_hours = round((end_dt - start_dt).total_seconds() / 3600, 2)
-                    
-                    session_detail = {
-                        "session_number": i + 1,
-                        "start_time": start_time,
-                        "end_time": end_time,
-                        "start_time_local": start_dt.strftime("%H:%M"),
-                        "end_time_local": end_dt.strftime("%H:%M"),
-                        "duration_hours": duration_hours,
-                        "type": dispatch_type
-                    }
-                    attrs["session_details"].append(session_detail)
-                    
-                except ValueError:
-                    continue
-        
-        # Add convenience attributes for automations
-        if attrs["session_details"]:
-            first_session = attrs["session_details"][0]
-            last_session = attrs["session_details"][-1]
-            
-            attrs["first_session_start"] = first_session["start_time"]
-            attrs["last_session_end"] = last_session["end_time"]
-            attrs["time_slots"] = [f"{s['start_time_local']}-{s['end_time_local']}" for s in attrs["session_details"]]
-        
-        return attrs
-
-
-class OctopusChargerLastSessionDateSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for last charging session date - NEW SENSOR."""
+        for number, (start, end, start_hm, end_hm, duration, dispatch_type) in enumerate(sessions, 1)
+    ]
+    
+    attrs = {
+        "device_id": sensor._device_id,
+        "total_sessions": len(session_details),
+        "session_details": session_details
+    }
+    
+    # Add convenience attributes for automations; sessions are sorted by start
+    if sessions:
+        attrs["first_session_start"] = sessions[0][0]
+        attrs["last_session_end"] = sessions[-1][1]
+        attrs["time_slots"] = parsed["time_ranges"]
+    
+    return attrs
 
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, device_id: str) -> None:
-        super().__init__(coordinator)
-        self._device_id = device_id
-        # ✅ FIXED: Añadir búsqueda de account_number
-        self._account_number = self._find_account_for_device(device_id)
-        
-        device = self._get_device_data()
-        device_name = device.get("name", "Charger") if device else "Charger"
-        self._attr_name = f"{device_name} Last Charge Date"
-        self._attr_unique_id = f"octopus_{device_id}_08_last_session_date"  # Updated from 05_ to 08_
-        self._attr_device_class = SensorDeviceClass.TIMESTAMP
-        self._attr_icon = "mdi:calendar-clock"
 
-    def _find_account_for_device(self, device_id: str) -> str | None:
-        """Find which account this device belongs to."""
-        for account_number, devices in self.coordinator.data.get("devices", {}).items():
-            for device in devices:
-                if device.get("id") == device_id:
-                    return account_number
-        return None
+def _last_session_field(field: str) -> Callable[[OctopusChargerSessionSensor], Any]:
+    """Build a value function reading one field of the last session summary."""
+    def value_fn(sensor: OctopusChargerSessionSensor) -> Any:
+        session = sensor._get_last_session()
+        return session[field] if session else None
+    return value_fn
 
-    def _get_device_data(self) -> dict[str, Any] | None:
-        """Get device data from coordinator - FIXED."""
-        if not self._account_number:
-            return None
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            pass
-        return None
 
-    def _get_last_session(self) -> dict[str, Any] | None:
-        """Get last session data - FIXED to match API structure."""
-        history_data = self.coordinator.data.get("charge_history", {}).get(self._device_id, [])
-        if history_data and len(history_data) > 0:
-            # history_data[0] is the device, get its charging sessions
-            device_data = history_data[0]
-            sessions = device_data.get("chargePointChargingSession", {}).get("edges", [])
-            if sessions:
-                return sessions[0]["node"]
-        return None
+def _last_session_cost(sensor: OctopusChargerSessionSensor) -> float:
+    """Return cost - 0 if cost is null as user requested."""
+    session = sensor._get_last_session()
+    if session and session["cost_eur"] is not None:
+        return session["cost_eur"]
+    return 0
 
-    @property
-    def native_value(self) -> datetime | None:
-        last_session = self._get_last_session()
-        if last_session:
-            start_time = last_session.get("start")
-            if start_time:
-                try:
-                    return datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                except ValueError:
-                    pass
-        return None
 
-    @property
-    def available(self) -> bool:
-        """ALWAYS available - show None if no data."""
-        return True
+def _last_session_attrs(sensor: OctopusChargerSessionSensor) -> dict[str, Any]:
+    session = sensor._get_last_session()
+    attrs = {"device_id": sensor._device_id}
+    
+    if session:
+        if session["start_raw"]:
+            attrs["start_time"] = session["start_raw"]
+        if session["end_raw"]:
+            attrs["end_time"] = session["end_raw"]
+        # Add session type if available
+        if session["type"]:
+            attrs["session_type"] = session["type"]
+    
+    return attrs
+
+
+@dataclass(frozen=True, kw_only=True)
+class ChargerSessionSensorEntityDescription(SensorEntityDescription):
+    """Description of a charger sensor derived from dispatches or charge history."""
+
+    prefix: str
+    value_fn: Callable[[OctopusChargerSessionSensor], Any]
+    attrs_fn: Callable[[OctopusChargerSessionSensor], dict[str, Any]] | None = None
+
+
+# Automation-friendly planned dispatch sensors first, then the last charge session
+CHARGER_SESSION_SENSORS: tuple[ChargerSessionSensorEntityDescription, ...] = (
+    ChargerSessionSensorEntityDescription(
+        key="next_session_start",
+        name="Next Session Start",
+        prefix=DEVICE_SENSOR_PREFIX_NEXT_SESSION_START,
+        icon="mdi:play-circle",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=_dispatch_field("first_start"),
+        attrs_fn=_session_count_attrs,
+    ),
+    ChargerSessionSensorEntityDescription(
+        key="last_session_end",
+        name="Last Session End",
+        prefix=DEVICE_SENSOR_PREFIX_NEXT_SESSION_END,
+        icon="mdi:stop-circle",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=_dispatch_field("last_end"),
+    ),
+    ChargerSessionSensorEntityDescription(
+        key="total_hours_today",
+        name="Total Hours Today",
+        prefix=DEVICE_SENSOR_PREFIX_TOTAL_HOURS_TODAY,
+        icon="mdi:clock-time-eight",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        value_fn=lambda sensor: sensor._get_parsed_dispatches().get("total_hours", 0.0),
+        attrs_fn=_session_details_attrs,
+    ),
+    ChargerSessionSensorEntityDescription(
+        key="last_session_date",
+        name="Last Charge Date",
+        prefix=DEVICE_SENSOR_PREFIX_LAST_SESSION_DATE,
+        icon="mdi:calendar-clock",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=_last_session_field("start"),
+        attrs_fn=_last_session_attrs,
+    ),
+    ChargerSessionSensorEntityDescription(
+        key="last_session_duration",
+        name="Last Session Duration",
+        prefix=DEVICE_SENSOR_PREFIX_LAST_SESSION_DURATION,
+        icon="mdi:timer",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        value_fn=_last_session_field("duration_h"),
+    ),
+    ChargerSessionSensorEntityDescription(
+        key="last_energy_added",
+        name="Last Energy Added",
+        prefix=DEVICE_SENSOR_PREFIX_LAST_ENERGY_ADDED,
+        icon="mdi:lightning-bolt",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        value_fn=_last_session_field("energy_kwh"),
+    ),
+    ChargerSessionSensorEntityDescription(
+        key="last_session_cost",
+        name="Last Session Cost",
+        prefix=DEVICE_SENSOR_PREFIX_LAST_SESSION_COST,
+        icon="mdi:currency-eur",
+        device_class=SensorDeviceClass.MONETARY,
+        native_unit_of_measurement=CURRENCY_EURO,
+        value_fn=_last_session_cost,
+    ),
+)
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
-        last_session = self._get_last_session()
-        attrs = {"device_id": self._device_id}
-        
-        if last_session:
-            start_time = last_session.get("start")
-            end_time = last_session.get("end")
-            
-            if start_time:
-                attrs["start_time"] = start_time
-            if end_time:
-                attrs["end_time"] = end_time
-                
-            # Add session type if available
-            session_type = last_session.get("type")
-            if session_type:
-                attrs["session_type"] = session_type
-        
-        return attrs
+class OctopusChargerSessionSensor(_DeviceScopedEntity):
+    """Charger sensor derived from planned dispatches or the last charge session."""
 
+    __slots__ = ()
 
-class OctopusChargerLastEnergyAddedSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for last charging session energy added - FIXED availability."""
+    entity_description: ChargerSessionSensorEntityDescription
 
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, device_id: str) -> None:
-        super().__init__(coordinator)
-        self._device_id = device_id
-        # ✅ FIXED: Añadir búsqueda de account_number
-        self._account_number = self._find_account_for_device(device_id)
+    def __init__(
+        self,
+        coordinator: OctopusSpainDataUpdateCoordinator,
+        device_id: str,
+        description: ChargerSessionSensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, device_id)
+        self.entity_description = description
         
-        device = self._get_device_data()
-        device_name = device.get("name", "Charger") if device else "Charger"
-        self._attr_name = f"{device_name} Last Energy Added"
-        self._attr_unique_id = f"octopus_{device_id}_10_last_energy_added"  # Updated from 07_
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL
-        self._attr_icon = "mdi:lightning-bolt"
-
-    def _find_account_for_device(self, device_id: str) -> str | None:
-        """Find which account this device belongs to."""
-        for account_number, devices in self.coordinator.data.get("devices", {}).items():
-            for device in devices:
-                if device.get("id") == device_id:
-                    return account_number
-        return None
-
-    def _get_device_data(self) -> dict[str, Any] | None:
-        """Get device data from coordinator - FIXED."""
-        if not self._account_number:
-            return None
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            pass
-        return None
+        device_name = coordinator.device_name_by_id.get(device_id, "Charger")
+        self._attr_name = f"{device_name} {description.name}"
+        self._attr_unique_id = sys.intern(f"octopus_{device_id}_{description.prefix}_{description.key}")
+        self._update_cached_state()
 
     def _get_last_session(self) -> dict[str, Any] | None:
-        """Get last session data - FIXED to match API structure."""
-        history_data = self.coordinator.data.get("charge_history", {}).get(self._device_id, [])
-        if history_data and len(history_data) > 0:
-            # history_data[0] is the device, get its charging sessions
-            device_data = history_data[0]
-            sessions = device_data.get("chargePointChargingSession", {}).get("edges", [])
-            if sessions:
-                return sessions[0]["node"]
-        return None
-
-    @property
-    def native_value(self) -> float | None:
-        last_session = self._get_last_session()
-        if last_session:
-            energy_data = last_session.get("energyAdded", {})
-            value = energy_data.get("value")
-            if value:
-                return float(value)
-        return None
-
-    @property
-    def available(self) -> bool:
-        """ALWAYS available - show 0 if no data."""
-        return True
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
-
-
-class OctopusChargerLastSessionDurationSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for last charging session duration - FIXED availability."""
-
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, device_id: str) -> None:
-        super().__init__(coordinator)
-        self._device_id = device_id
-        # ✅ FIXED: Añadir búsqueda de account_number
-        self._account_number = self._find_account_for_device(device_id)
-        
-        device = self._get_device_data()
-        device_name = device.get("name", "Charger") if device else "Charger"
-        self._attr_name = f"{device_name} Last Session Duration"
-        self._attr_unique_id = f"octopus_{device_id}_09_last_session_duration"  # Updated from 06_
-        self._attr_native_unit_of_measurement = UnitOfTime.HOURS
-        self._attr_device_class = SensorDeviceClass.DURATION
-        self._attr_icon = "mdi:timer"
-
-    def _find_account_for_device(self, device_id: str) -> str | None:
-        """Find which account this device belongs to."""
-        for account_number, devices in self.coordinator.data.get("devices", {}).items():
-            for device in devices:
-                if device.get("id") == device_id:
-                    return account_number
-        return None
+        """Get the last charge session summarized by the coordinator."""
+        return self.coordinator.data.get("last_sessions", {}).get(self._device_id)
 
-    def _get_device_data(self) -> dict[str, Any] | None:
-        """Get device data from coordinator - FIXED."""
-        if not self._account_number:
-            return None
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            pass
-        return None
+    def _update_cached_state(self) -> None:
+        """Compute state and attributes once per coordinator refresh."""
+        description = self.entity_description
+        self._cached_value = description.value_fn(self)
+        self._cached_attrs = description.attrs_fn(self) if description.attrs_fn else None
 
-    def _get_last_session(self) -> dict[str, Any] | None:
-        """Get last session data - FIXED to match API structure."""
-        history_data = self.coordinator.data.get("charge_history", {}).get(self._device_id, [])
-        if history_data and len(history_data) > 0:
-            # history_data[0] is the device, get its charging sessions
-            device_data = history_data[0]
-            sessions = device_data.get("chargePointChargingSession", {}).get("edges", [])
-            if sessions:
-                return sessions[0]["node"]
-        return None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
 
     @property
-    def native_value(self) -> float | None:
-        last_session = self._get_last_session()
-        if last_session:
-            start_time = last_session.get("start")
-            end_time = last_session.get("end")
-            
-            if start_time and end_time:
-                try:
-                    start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-                    duration = (end_dt - start_dt).total_seconds() / 3600
-                    return round(duration, 1)
-                except ValueError:
-                    pass
-        return None
+    def native_value(self) -> Any:
+        return self._cached_value
 
     @property
     def available(self) -> bool:
@@ -1854,77 +1414,5 @@ class OctopusChargerLastSessionDurationSensor(CoordinatorEntity, SensorEntity):
         return True
 
     @property
-    def device_info(self) -> dict[str, Any]:
-        device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
-
-
-class OctopusChargerLastSessionCostSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for last session cost - FIXED availability and cost handling."""
-
-    def __init__(self, coordinator: OctopusSpainDataUpdateCoordinator, device_id: str) -> None:
-        super().__init__(coordinator)
-        self._device_id = device_id
-        # ✅ FIXED: Añadir búsqueda de account_number
-        self._account_number = self._find_account_for_device(device_id)
-        
-        device = self._get_device_data()
-        device_name = device.get("name", "Charger") if device else "Charger"
-        self._attr_name = f"{device_name} Last Session Cost"
-        self._attr_unique_id = f"octopus_{device_id}_11_last_session_cost"  # Updated from 08_
-        self._attr_native_unit_of_measurement = CURRENCY_EURO
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_icon = "mdi:currency-eur"
-
-    def _find_account_for_device(self, device_id: str) -> str | None:
-        """Find which account this device belongs to."""
-        for account_number, devices in self.coordinator.data.get("devices", {}).items():
-            for device in devices:
-                if device.get("id") == device_id:
-                    return account_number
-        return None
-
-    def _get_device_data(self) -> dict[str, Any] | None:
-        """Get device data from coordinator - FIXED."""
-        if not self._account_number:
-            return None
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            pass
-        return None
-
-    def _get_last_session(self) -> dict[str, Any] | None:
-        """Get last session data - FIXED to match API structure.""" 
-        history_data = self.coordinator.data.get("charge_history", {}).get(self._device_id, [])
-        if history_data and len(history_data) > 0:
-            # history_data[0] is the device, get its charging sessions
-            device_data = history_data[0]
-            sessions = device_data.get("chargePointChargingSession", {}).get("edges", [])
-            if sessions:
-                return sessions[0]["node"]
-        return None
-
-    @property
-    def native_value(self) -> float:
-        """Return cost - 0 if cost is null as user requested."""
-        last_session = self._get_last_session()
-        if last_session:
-            cost_data = last_session.get("cost")
-            if cost_data and cost_data.get("amount"):
-                return float(cost_data["amount"])
-        # Return 0 if cost is null (as user requested)
-        return 0
-
-    @property
-    def available(self) -> bool:
-        """ALWAYS available - show 0 if no data."""
-        return True
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
\ No newline at end of file
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        return self._cached_attrs
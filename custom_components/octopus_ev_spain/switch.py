@@ -1,21 +1,51 @@
 """Switch platform for Octopus Energy Spain - SIMPLIFIED."""
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
+from aiohttp import ClientError
+
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .api import OctopusSpainAPIError
+from .const import DOMAIN, CONNECTED_STATES
 from .coordinator import OctopusSpainDataUpdateCoordinator
+from .helpers import device_current_state, safe_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+# Queue one toggle at a time; the API calls themselves go through the
+# coordinator's charger_write_lock
+PARALLEL_UPDATES = 1
+
+# Quiet period before the boost change is sent to the API; every toggle restarts it
+TOGGLE_DEBOUNCE = 0.5
+
+# Spanish explanation of each charger state
+STATE_EXPLANATIONS: dict[str, str] = {
+    "SMART_CONTROL_NOT_AVAILABLE": "Coche desconectado",
+    "SMART_CONTROL_CAPABLE": "Conectado, listo para cargar",
+    "BOOSTING": "Carga rápida activa",
+    "SMART_CONTROL_IN_PROGRESS": "Carga programada en curso",
+}
+
+# (can_start_boost, can_stop_boost, reason) for each charger state
+BOOST_CAPABILITIES: dict[str, tuple[bool, bool, str]] = {
+    "SMART_CONTROL_NOT_AVAILABLE": (False, False, "Coche no conectado"),
+    "SMART_CONTROL_CAPABLE": (True, False, "Listo para iniciar carga"),
+    "BOOSTING": (False, True, "Carga rápida en progreso"),
+    # Can switch to boost from scheduled charging
+    "SMART_CONTROL_IN_PROGRESS": (True, False, "Puede cambiar a carga rápida"),
+}
+_UNKNOWN_BOOST_CAPABILITY = (False, False, "Estado desconocido")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -25,39 +55,42 @@ async def async_setup_entry(
     """Set up Octopus Energy Spain switches."""
     coordinator: OctopusSpainDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[SwitchEntity] = []
-
-    # Add boost charge switches for each charger
-    for account_number, devices in coordinator.data.get("devices", {}).items():
-        for device in devices:
-            if device.get("__typename") == "SmartFlexChargePoint":
-                entities.append(OctopusBoostChargeSwitch(coordinator, account_number, device["id"]))
-
-    async_add_entities(entities)
+    known_device_ids: set[str] = set()
 
+    @callback
+    def _async_add_new_chargers() -> None:
+        """Add boost switches for chargers that do not have one yet."""
+        new_chargers = [
+            (account_number, device)
+            for account_number, device in coordinator.chargepoint_devices
+            if device["id"] not in known_device_ids
+        ]
+        if not new_chargers:
+            return
+        known_device_ids.update(device["id"] for _, device in new_chargers)
+        # The switches snapshot the coordinator data when built, so there is
+        # nothing to update before adding them
+        async_add_entities(
+            [
+                OctopusBoostChargeSwitch(coordinator, account_number, device["id"])
+                for account_number, device in new_chargers
+            ],
+            update_before_add=False,
+        )
 
-def _safe_device_info(device_id: str, device: dict[str, Any] | None) -> dict[str, Any]:
-    """Safely create device info."""
-    if not device:
-        return {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": "Dispositivo Desconocido",
-            "manufacturer": "Lockevod",
-            "model": "Desconocido",
-        }
-        
-    return {
-        "identifiers": {(DOMAIN, device_id)},
-        "name": device.get("name", "Dispositivo Desconocido"),
-        "manufacturer": "Lockevod",
-        "model": f"{device.get('__typename', 'Desconocido')} ({device.get('provider', 'Desconocido')})",
-        "sw_version": device.get("deviceType", "Desconocido"),
-    }
+    # Add boost charge switches for each charger, and for any that only shows up
+    # in a later refresh (no data yet, or a charger added to the account)
+    _async_add_new_chargers()
+    config_entry.async_on_unload(coordinator.async_add_listener(_async_add_new_chargers))
 
 
 class OctopusBoostChargeSwitch(CoordinatorEntity, SwitchEntity):
     """Switch for controlling boost charging."""
 
+    __slots__ = ()
+
+    _attr_icon = "mdi:ev-station"
+
     def __init__(
         self,
         coordinator: OctopusSpainDataUpdateCoordinator,
@@ -69,68 +102,60 @@ class OctopusBoostChargeSwitch(CoordinatorEntity, SwitchEntity):
         self._account_number = account_number
         self._device_id = device_id
         
-        device = self._get_device_data()
+        self._device = device = self._get_device_data()
+        self._attr_device_info = safe_device_info(device_id, device)
         device_name = device.get("name", "Dispositivo Desconocido") if device else "Dispositivo Desconocido"
         self._attr_name = f"{device_name} Carga Rápida"
         self._attr_unique_id = f"octopus_{device_id}_boost_charge"
-        self._attr_icon = "mdi:ev-station"
+        self._requested_boost = False
+        self._boost_before_burst: bool | None = None
+        self._cancel_boost_send: CALLBACK_TYPE | None = None
+        self._boost_sending = False
+        self._update_cached_state()
 
     def _get_device_data(self) -> dict[str, Any] | None:
         """Get device data from coordinator."""
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            _LOGGER.warning("Failed to get device data for %s", self._device_id)
-        return None
+        return self.coordinator.devices_by_id.get(self._device_id)
 
-    def _get_current_state(self) -> str | None:
-        """Get current device state."""
-        try:
-            device = self._get_device_data()
-            if device:
-                return device.get("status", {}).get("currentState")
-        except (KeyError, TypeError, AttributeError):
-            pass
-        return None
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
+    def _device_and_state(self) -> tuple[dict[str, Any] | None, str | None]:
+        """Get the device data and its current state with a single lookup."""
         device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
+        return device, device_current_state(device)
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return if boost charging is on."""
-        current_state = self._get_current_state()
-        return current_state == "BOOSTING"
+    def _update_cached_state(self) -> None:
+        """Snapshot the charger, its state, availability and attributes once per coordinator refresh."""
+        device, self._current_state = self._device_and_state()
+        if device is not self._device:
+            # Only rebuilt when the coordinator replaced the device record
+            self._attr_device_info = safe_device_info(self._device_id, device)
+            self._device = device
+        current_state = self._current_state
+        self._attr_is_on = current_state == "BOOSTING"
+        # Switch is available when car is connected
+        self._attr_available = current_state in CONNECTED_STATES
+        if not self._attr_available:
+            _LOGGER.debug("Boost switch unavailable for device %s: state is %s", self._device_id, current_state)
+        self._cached_attrs = self._build_attrs(device, current_state)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        previous = (self._current_state, self._cached_attrs)
+        self._update_cached_state()
+        # is_on and available follow the state, so both unchanged means nothing to write
+        if (self._current_state, self._cached_attrs) == previous:
+            return
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return if the switch is available."""
-        current_state = self._get_current_state()
-        
-        # Switch is available when car is connected
-        connected_states = [
-            "SMART_CONTROL_CAPABLE",     # Connected, ready
-            "SMART_CONTROL_IN_PROGRESS", # Charging in scheduled session 
-            "BOOSTING"                   # Already boosting
-        ]
-        
-        is_available = current_state in connected_states
-        
-        if not is_available:
-            _LOGGER.debug("Boost switch unavailable for device %s: state is %s", self._device_id, current_state)
-        
-        return is_available
+        # Only the charger state counts, as before, not the coordinator's last refresh
+        return self._attr_available
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Start boost charging."""
-        current_state = self._get_current_state()
-        device = self._get_device_data()
+        device, current_state = self._device_and_state()
         device_name = device.get("name", "Unknown") if device else "Unknown"
         
         _LOGGER.info("Starting boost charge for %s (current state: %s)", device_name, current_state)
@@ -142,24 +167,13 @@ class OctopusBoostChargeSwitch(CoordinatorEntity, SwitchEntity):
             
         if current_state == "SMART_CONTROL_NOT_AVAILABLE":
             _LOGGER.error("Cannot start boost charging - car not connected to %s", device_name)
-            raise Exception("Coche no conectado - no se puede iniciar carga rápida")
+            raise HomeAssistantError("Coche no conectado - no se puede iniciar carga rápida")
         
-        try:
-            await self.coordinator.api.start_boost_charge(self._device_id)
-            _LOGGER.info("Started boost charging for %s", device_name)
-            
-            # Wait for change to propagate, then refresh
-            await asyncio.sleep(3)
-            await self.coordinator.async_refresh_specific_device(self._device_id)
-            
-        except Exception as err:
-            _LOGGER.error("Failed to start boost charging for %s: %s", device_name, err)
-            raise
+        await self._async_queue_boost(True, current_state)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Stop boost charging."""
-        current_state = self._get_current_state()
-        device = self._get_device_data()
+        device, current_state = self._device_and_state()
         device_name = device.get("name", "Unknown") if device else "Unknown"
         
         _LOGGER.info("Stopping boost charge for %s (current state: %s)", device_name, current_state)
@@ -169,24 +183,93 @@ class OctopusBoostChargeSwitch(CoordinatorEntity, SwitchEntity):
             _LOGGER.warning("Boost charging not active for %s (state: %s)", device_name, current_state)
             return
         
+        await self._async_queue_boost(False, current_state)
+
+    async def _async_queue_boost(self, boost: bool, current_state: str | None) -> None:
+        """Show the requested boost state now and send it once the toggling settles."""
+        if self._boost_before_burst is None:
+            # First toggle of a burst: remember what the API last reported
+            self._boost_before_burst = current_state == "BOOSTING"
+        self._requested_boost = boost
+        self.coordinator.async_store_device_state(
+            self._device_id, "BOOSTING" if boost else "SMART_CONTROL_CAPABLE"
+        )
+        self._schedule_boost_send()
+
+    @callback
+    def _schedule_boost_send(self) -> None:
+        """(Re)start the quiet period before the requested boost state is sent."""
+        if self._cancel_boost_send is not None:
+            self._cancel_boost_send()
+        self._cancel_boost_send = async_call_later(self.hass, TOGGLE_DEBOUNCE, self._async_apply_boost)
+
+    async def _async_apply_boost(self, _now: Any = None) -> None:
+        """Send the last requested boost state, unless the burst cancelled itself out."""
+        self._cancel_boost_send = None
+        if self._boost_sending:
+            # The previous change is still on its way; look again once it is through
+            self._schedule_boost_send()
+            return
+
+        boost = self._requested_boost
+        was_boosting = self._boost_before_burst
+        device_name = self.coordinator.device_name_by_id.get(self._device_id) or "Unknown"
+        
+        self._boost_sending = True
         try:
-            await self.coordinator.api.stop_boost_charge(self._device_id)
-            _LOGGER.info("Stopped boost charging for %s", device_name)
-            
-            # Wait for change to propagate, then refresh
-            await asyncio.sleep(3)
-            await self.coordinator.async_refresh_specific_device(self._device_id)
-            
-        except Exception as err:
-            _LOGGER.error("Failed to stop boost charging for %s: %s", device_name, err)
-            raise
+            if boost != was_boosting:
+                try:
+                    # One charger change at a time, even when a scene toggles several
+                    async with self.coordinator.charger_write_lock:
+                        if boost:
+                            await self.coordinator.api.start_boost_charge(self._device_id)
+                            _LOGGER.info("Started boost charging for %s", device_name)
+                        else:
+                            await self.coordinator.api.stop_boost_charge(self._device_id)
+                            _LOGGER.info("Stopped boost charging for %s", device_name)
+                except (OctopusSpainAPIError, ClientError, TimeoutError) as err:
+                    _LOGGER.error(
+                        "Failed to %s boost charging for %s: %s", "start" if boost else "stop", device_name, err
+                    )
+                    # The switch already shows the requested state, so say why it flips back
+                    self.hass.async_create_task(
+                        self.hass.services.async_call(
+                            "persistent_notification",
+                            "create",
+                            {
+                                "title": f"❌ {device_name}",
+                                "message": (
+                                    f"Error al {'iniciar' if boost else 'detener'} la carga rápida: {err}"
+                                ),
+                                "notification_id": f"charger_boost_error_{self._device_id}",
+                            },
+                        )
+                    )
+                else:
+                    # The API has this state now; toggles made meanwhile compare against it
+                    self._boost_before_burst = boost
+        finally:
+            self._boost_sending = False
+            if self._cancel_boost_send is None:
+                # Nobody toggled while the call was out: the burst is over
+                self._boost_before_burst = None
+            # Confirm the optimistic state, or put back the real one, whatever went wrong
+            await self.coordinator.async_request_device_refresh(self._device_id)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop a pending boost change when the entity goes away."""
+        if self._cancel_boost_send is not None:
+            self._cancel_boost_send()
+            self._cancel_boost_send = None
+        await super().async_will_remove_from_hass()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        device = self._get_device_data()
-        current_state = self._get_current_state()
-        
+        return self._cached_attrs
+
+    def _build_attrs(self, device: dict[str, Any] | None, current_state: str | None) -> dict[str, Any]:
+        """Build the extra attributes for a charger snapshot."""
         attrs = {
             "device_id": self._device_id,
             "account_number": self._account_number,
@@ -194,50 +277,22 @@ class OctopusBoostChargeSwitch(CoordinatorEntity, SwitchEntity):
         }
 
         if device:
-            attrs.update({
-                "device_type": device.get("deviceType"),
-                "provider": device.get("provider"),
-                "property_id": device.get("propertyId"),
-            })
+            get = device.get
+            attrs["device_type"] = get("deviceType")
+            attrs["provider"] = get("provider")
+            attrs["property_id"] = get("propertyId")
 
         # Add state explanation in Spanish
-        state_explanations = {
-            "SMART_CONTROL_NOT_AVAILABLE": "Coche desconectado",
-            "SMART_CONTROL_CAPABLE": "Conectado, listo para cargar",
-            "BOOSTING": "Carga rápida activa",
-            "SMART_CONTROL_IN_PROGRESS": "Carga programada en curso"
-        }
-        
-        attrs["state_explanation"] = state_explanations.get(current_state, "Estado desconocido")
+        attrs["state_explanation"] = STATE_EXPLANATIONS.get(current_state, "Estado desconocido")
         
         # Add connection status
-        attrs["is_connected"] = current_state in [
-            "SMART_CONTROL_CAPABLE", 
-            "BOOSTING", 
-            "SMART_CONTROL_IN_PROGRESS"
-        ]
+        attrs["is_connected"] = current_state in CONNECTED_STATES
         
         # Add capabilities based on current state
-        if current_state == "SMART_CONTROL_NOT_AVAILABLE":
-            attrs["can_start_boost"] = False
-            attrs["can_stop_boost"] = False
-            attrs["reason"] = "Coche no conectado"
-        elif current_state == "SMART_CONTROL_CAPABLE":
-            attrs["can_start_boost"] = True
-            attrs["can_stop_boost"] = False
-            attrs["reason"] = "Listo para iniciar carga"
-        elif current_state == "BOOSTING":
-            attrs["can_start_boost"] = False
-            attrs["can_stop_boost"] = True
-            attrs["reason"] = "Carga rápida en progreso"
-        elif current_state == "SMART_CONTROL_IN_PROGRESS":
-            attrs["can_start_boost"] = True  # Can switch to boost from scheduled charging
-            attrs["can_stop_boost"] = False
-            attrs["reason"] = "Puede cambiar a carga rápida"
-        else:
-            attrs["can_start_boost"] = False
-            attrs["can_stop_boost"] = False
-            attrs["reason"] = "Estado desconocido"
+        can_start, can_stop, reason = BOOST_CAPABILITIES.get(current_state, _UNKNOWN_BOOST_CAPABILITY)
+        attrs["can_start_boost"] = can_start
+        attrs["can_stop_boost"] = can_stop
+        attrs["reason"] = reason
 
         # Add planned dispatches info
         try:
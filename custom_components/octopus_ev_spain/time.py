@@ -1,22 +1,25 @@
 """Time platform for Octopus Energy Spain - SIMPLIFIED."""
 from __future__ import annotations
 
-import asyncio
 import logging
 from datetime import time
 from typing import Any
 
 from homeassistant.components.time import TimeEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, DEFAULT_MAX_PERCENTAGE, DAYS_OF_WEEK
+from .const import DOMAIN, DEFAULT_MAX_PERCENTAGE, DAYS_OF_WEEK, VALID_TIME_OPTIONS
 from .coordinator import OctopusSpainDataUpdateCoordinator
+from .helpers import safe_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+# Send one charger change at a time to the Octopus API
+PARALLEL_UPDATES = 1
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,42 +29,20 @@ async def async_setup_entry(
     """Set up Octopus Energy Spain time entities."""
     coordinator: OctopusSpainDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[TimeEntity] = []
-
     # Add time configuration entities for each charger
-    for account_number, devices in coordinator.data.get("devices", {}).items():
-        for device in devices:
-            if device.get("__typename") == "SmartFlexChargePoint":
-                device_id = device["id"]
-                entities.append(
-                    OctopusChargerTargetTimeEntity(coordinator, account_number, device_id)
-                )
-
-    async_add_entities(entities)
-
-
-def _safe_device_info(device_id: str, device: dict[str, Any] | None) -> dict[str, Any]:
-    """Safely create device info."""
-    if not device:
-        return {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": "Dispositivo Desconocido",
-            "manufacturer": "Lockevod",
-            "model": "Desconocido",
-        }
-        
-    return {
-        "identifiers": {(DOMAIN, device_id)},
-        "name": device.get("name", "Dispositivo Desconocido"),
-        "manufacturer": "Lockevod",
-        "model": f"{device.get('__typename', 'Desconocido')} ({device.get('provider', 'Desconocido')})",
-        "sw_version": device.get("deviceType", "Desconocido"),
-    }
+    async_add_entities([
+        OctopusChargerTargetTimeEntity(coordinator, account_number, device["id"])
+        for account_number, device in coordinator.chargepoint_devices
+    ])
 
 
 class OctopusChargerTargetTimeEntity(CoordinatorEntity, TimeEntity):
     """Time entity for charger target time configuration."""
 
+    __slots__ = ()
+
+    _attr_icon = "mdi:clock-time-four"
+
     def __init__(
         self,
         coordinator: OctopusSpainDataUpdateCoordinator,
@@ -72,62 +53,73 @@ class OctopusChargerTargetTimeEntity(CoordinatorEntity, TimeEntity):
         super().__init__(coordinator)
         self._account_number = account_number
         self._device_id = device_id
+        self._device = device = self._get_device_data()
+        self._attr_device_info = safe_device_info(device_id, device)
         
-        device = self._get_device_data()
         device_name = device.get("name", "Cargador") if device else "Cargador"
         self._attr_name = f"{device_name} Hora Objetivo"
         self._attr_unique_id = f"octopus_{device_id}_target_time"
-        self._attr_icon = "mdi:clock-time-four"
+        self._update_cached_state()
 
     def _get_device_data(self) -> dict[str, Any] | None:
         """Get device data from coordinator."""
-        try:
-            devices = self.coordinator.data.get("devices", {}).get(self._account_number, [])
-            for device in devices:
-                if device.get("id") == self._device_id:
-                    return device
-        except (KeyError, TypeError, AttributeError):
-            _LOGGER.warning("Failed to get device data for %s", self._device_id)
-        return None
+        return self.coordinator.devices_by_id.get(self._device_id)
+
+    def _update_cached_state(self) -> None:
+        """Rebind the device record and parse the target time once per coordinator refresh."""
+        device = self._get_device_data()
+        if device is not self._device:
+            # Only rebuilt when the coordinator replaced the device record
+            self._attr_device_info = safe_device_info(self._device_id, device)
+            self._device = device
+        self._preferences = preferences = self._get_preferences()
+        self._attr_native_value = self._parse_target_time(preferences)
+        self._attr_extra_state_attributes = self._build_attrs(preferences)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
 
     def _get_preferences(self) -> dict[str, Any] | None:
         """Get device preferences."""
-        try:
-            preferences_data = self.coordinator.data.get("device_preferences", {}).get(self._device_id, {})
-            # Check structure
-            if isinstance(preferences_data, dict) and "preferences" in preferences_data:
-                return preferences_data["preferences"]
-            elif isinstance(preferences_data, dict) and "schedules" in preferences_data:
-                return preferences_data
-        except (KeyError, TypeError, AttributeError):
-            pass
+        data = self.coordinator.data
+        preferences_data = data.get("device_preferences", {}).get(self._device_id) if data else None
+        if not isinstance(preferences_data, dict):
+            return None
+        # Check structure
+        if "preferences" in preferences_data:
+            return preferences_data["preferences"]
+        if "schedules" in preferences_data:
+            return preferences_data
         return None
 
-    @property
-    def native_value(self) -> time | None:
-        """Return the current target time."""
-        preferences = self._get_preferences()
+    def _parse_target_time(self, preferences: dict[str, Any] | None) -> time:
+        """Return the target time stored in the charger preferences."""
         if preferences:
             schedules = preferences.get("schedules", [])
             if schedules:
                 time_str = schedules[0].get("time", "10:30")
                 if time_str:
                     try:
-                        # Handle both "10:30" and "10:30:00" formats
-                        time_parts = time_str.split(":")
-                        hour = int(time_parts[0])
-                        minute = int(time_parts[1])
-                        
+                        # Handle both "10:30" and "10:30:00" formats, ignoring the seconds
+                        parsed_time = time.fromisoformat(time_str).replace(second=0, microsecond=0)
+                    except ValueError:
+                        # Hours without a leading zero, such as "9:30", as the old parser took them
+                        try:
+                            hour, minute = time_str.split(":")[:2]
+                            parsed_time = time(int(hour), int(minute))
+                        except ValueError:
+                            parsed_time = None
+                    if parsed_time is None:
+                        _LOGGER.warning("Invalid time format: %s", time_str)
+                    else:
                         # Validate time is within allowed range (04:00-11:00) and valid 30min steps
-                        parsed_time = time(hour, minute)
                         if self._is_valid_time(parsed_time):
                             return parsed_time
-                        else:
-                            _LOGGER.warning("Time %s outside allowed range, using default", time_str)
-                            return time(10, 30)  # Default fallback
-                            
-                    except (ValueError, IndexError):
-                        _LOGGER.warning("Invalid time format: %s", time_str)
+                        _LOGGER.warning("Time %s outside allowed range, using default", time_str)
+                        return time(10, 30)  # Default fallback
         return time(10, 30)  # Default time
 
     def _is_valid_time(self, check_time: time) -> bool:
@@ -137,7 +129,7 @@ class OctopusChargerTargetTimeEntity(CoordinatorEntity, TimeEntity):
             return False
         
         # Minutes must be 00 or 30 (30-minute steps)
-        if check_time.minute not in [0, 30]:
+        if check_time.minute not in (0, 30):
             return False
             
         return True
@@ -170,8 +162,7 @@ class OctopusChargerTargetTimeEntity(CoordinatorEntity, TimeEntity):
     def available(self) -> bool:
         """Return if entity is available."""
         # Time configuration should always be available if preferences exist
-        preferences = self._get_preferences()
-        if preferences is None:
+        if self._preferences is None:
             _LOGGER.debug("Target time unavailable for %s: no preferences", self._device_id)
             return False
         return True
@@ -202,16 +193,14 @@ class OctopusChargerTargetTimeEntity(CoordinatorEntity, TimeEntity):
                     current_max = schedules[0].get("max", DEFAULT_MAX_PERCENTAGE)
             
             # Create new schedules for all days
-            schedules = []
-            for day in DAYS_OF_WEEK:
-                schedules.append({
-                    "dayOfWeek": day,
-                    "time": new_time,
-                    "max": float(current_max)
-                })
+            max_value = float(current_max)
+            schedules = [
+                {"dayOfWeek": day, "time": new_time, "max": max_value}
+                for day in DAYS_OF_WEEK
+            ]
             
             # Update preferences
-            await self.coordinator.api.set_smart_flex_device_preferences(
+            updated = await self.coordinator.api.set_smart_flex_device_preferences(
                 device_id=self._device_id,
                 mode="CHARGE",
                 unit="PERCENTAGE",
@@ -220,42 +209,34 @@ class OctopusChargerTargetTimeEntity(CoordinatorEntity, TimeEntity):
             
             _LOGGER.info("Successfully updated target time for %s to %s", device_name, new_time)
             
-            # Refresh data
-            await asyncio.sleep(2)
-            await self.coordinator.async_refresh_specific_device(self._device_id)
+            # Show the accepted preferences now; the refresh only confirms them
+            self.coordinator.async_store_device_preferences(self._device_id, updated)
+            await self.coordinator.async_request_device_refresh(self._device_id)
             
-            # Send notification using persistent_notification.create
-            await self.hass.services.async_call(
-                "persistent_notification",
-                "create",
-                {
-                    "title": f"⏰ {device_name}",
-                    "message": f"Hora objetivo actualizada a {new_time}",
-                    "notification_id": f"charger_target_time_{self._device_id}",
-                },
+            # Send notification using persistent_notification.create, without holding up the write
+            self.hass.async_create_task(
+                self.hass.services.async_call(
+                    "persistent_notification",
+                    "create",
+                    {
+                        "title": f"⏰ {device_name}",
+                        "message": f"Hora objetivo actualizada a {new_time}",
+                        "notification_id": f"charger_target_time_{self._device_id}",
+                    },
+                )
             )
             
         except Exception as err:
             _LOGGER.error("Failed to set target time for device %s: %s", self._device_id, err)
             raise
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        device = self._get_device_data()
-        return _safe_device_info(self._device_id, device)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        preferences = self._get_preferences()
+    def _build_attrs(self, preferences: dict[str, Any] | None) -> dict[str, Any]:
+        """Build the extra attributes for a preferences snapshot."""
         attrs = {
             "device_id": self._device_id,
             "allowed_range": "04:00 - 11:00",
             "allowed_steps": "30 minutos",
-            "valid_times": ["04:00", "04:30", "05:00", "05:30", "06:00", "06:30", 
-                           "07:00", "07:30", "08:00", "08:30", "09:00", "09:30",
-                           "10:00", "10:30", "11:00"]
+            "valid_times": VALID_TIME_OPTIONS,
         }
         
         if preferences: